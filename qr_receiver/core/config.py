@@ -64,6 +64,7 @@ class QRReceiverConfig:
     # Protocol Configuration (Compatible with qr_transfer)
     supported_formats: List[str] = field(default_factory=lambda: ["qrfile/v2", "qrfile/v1"])
     max_file_size: str = "500MB"
+    max_decompressed_size: int = 2 * 1024 ** 3  # Bytes; guards against decompression bombs
     chunk_timeout: int = 30
     max_chunks: int = 10000
     
@@ -84,6 +85,7 @@ class QRReceiverConfig:
     
     # Encryption Support (matching qr_transfer)
     supported_encryption: List[str] = field(default_factory=lambda: ["aes-256"])
+    encryption_password: Optional[str] = None  # Shared secret for encrypted transfers
     
     # Error Correction Support (matching qr_transfer)
     reed_solomon_enabled: bool = True
@@ -212,6 +214,7 @@ class QRReceiverConfig:
         return {
             "supported_formats": self.supported_formats,
             "max_file_size": self.max_file_size,
+            "max_decompressed_size": self.max_decompressed_size,
             "chunk_timeout": self.chunk_timeout,
             "max_chunks": self.max_chunks,
             "compression": self.supported_compression,
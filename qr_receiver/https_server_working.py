@@ -6,11 +6,13 @@ Windows-compatible (no Unicode issues)
 """
 import http.server
 import ssl
-import socketserver
 import os
 import socket
 import sys
-import io
+import shutil
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 # Try to import yaml, install if missing
@@ -22,32 +24,111 @@ except ImportError:
     subprocess.check_call([sys.executable, "-m", "pip", "install", "pyyaml"])
     import yaml
 
+# Prefer the libyaml C loader; fall back to the pure-Python one
+try:
+    from yaml import CSafeLoader as _YamlLoader
+except ImportError:
+    from yaml import SafeLoader as _YamlLoader
+
+# aiohttp is optional; without it we fall back to the threaded stdlib server
+try:
+    from aiohttp import web
+except ImportError:
+    web = None
+
+# Receiver pages in order of preference
+RECEIVER_FILES = (
+    'qr_receiver_integrity.html',
+    'qr_receiver_nimiq.html',
+    'qr_receiver_advanced.html',
+)
+
+# CORS headers for camera access, sent with every served file
+RESPONSE_HEADERS = {
+    'Access-Control-Allow-Origin': '*',
+    'Access-Control-Allow-Methods': 'GET, POST, OPTIONS',
+    'Access-Control-Allow-Headers': 'Content-Type',
+    'Cache-Control': 'no-cache, no-store, must-revalidate',
+    'Pragma': 'no-cache',
+    'Expires': '0',
+}
+
+# Opt-in reuse of the memory certificate (security.cache_memory_certificate).
+# The private key is stored encrypted with the passphrase from
+# CERT_CACHE_KEY_ENV, which is never written next to the cache file.
+CERT_CACHE_FILE = Path.home() / '.cache' / 'qr_receiver' / 'cert.bin'
+CERT_CACHE_KEY_ENV = 'QR_RECEIVER_CERT_CACHE_KEY'
+
+# Parsed config.yaml, keyed on (mtime_ns, size) so edits are still picked up
+_CONFIG_CACHE: dict = {}
+
 def load_config():
-    """Load configuration from config.yaml"""
+    """Load configuration from config.yaml (cached until the file changes)"""
+    # A missing config stays missing for the life of the process
+    if _CONFIG_CACHE.get('missing'):
+        return {}
+
     try:
-        if os.path.exists('config.yaml'):
-            with open('config.yaml', 'r') as f:
-                return yaml.safe_load(f)
+        st = os.stat('config.yaml')
+    except FileNotFoundError:
+        _CONFIG_CACHE['missing'] = True
+        return {}
+    except OSError:
         return {}
+
+    key = (st.st_mtime_ns, st.st_size)
+    if _CONFIG_CACHE.get('key') == key:
+        return _CONFIG_CACHE['value']
+
+    try:
+        with open('config.yaml', 'r') as f:
+            value = yaml.load(f, Loader=_YamlLoader) or {}
     except:
         return {}
 
+    _CONFIG_CACHE['key'] = key
+    _CONFIG_CACHE['value'] = value
+    return value
+
+# (directory mtime_ns, names) snapshot of the working directory
+_CWD_ENTRIES = (None, frozenset())
+
+def cwd_entries():
+    """Names in the working directory, re-listed only when it changes"""
+    global _CWD_ENTRIES
+    mtime = os.stat('.').st_mtime_ns
+    cached_mtime, entries = _CWD_ENTRIES
+    if cached_mtime != mtime:
+        with os.scandir('.') as it:
+            entries = frozenset(entry.name for entry in it)
+        _CWD_ENTRIES = (mtime, entries)
+    return entries
+
+# Local IP is looked up once; it does not change while the server runs
+_LOCAL_IP = None
+
 def get_local_ip():
-    """Get local IP address"""
+    """Get local IP address (cached for the process lifetime)"""
+    global _LOCAL_IP
+    if _LOCAL_IP is not None:
+        return _LOCAL_IP
+
     try:
         with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
             s.connect(("8.8.8.8", 80))
-            return s.getsockname()[0]
+            _LOCAL_IP = s.getsockname()[0]
     except:
-        return "127.0.0.1"
+        _LOCAL_IP = "127.0.0.1"
+    return _LOCAL_IP
 
 def install_cryptography():
     """Try to install cryptography library automatically"""
     print("Installing cryptography library...")
     try:
         import subprocess
+        # Only stderr is ever read, so pip's stdout is discarded unbuffered
         result = subprocess.run([sys.executable, "-m", "pip", "install", "cryptography"], 
-                              capture_output=True, text=True)
+                              stdout=subprocess.DEVNULL, stderr=subprocess.PIPE, text=True)
         if result.returncode == 0:
             print("SUCCESS: cryptography installed!")
             return True
@@ -65,19 +146,107 @@ def create_certificate():
     use_memory = config.get('security', {}).get('memory_certificates', False)
     
     if use_memory:
-        return create_memory_certificate()
+        security = config.get('security', {})
+        # Zero-persistence / memory-only setups never write the key to disk
+        cache = (security.get('cache_memory_certificate', False)
+                 and not security.get('zero_persistence', False)
+                 and not security.get('memory_only', False))
+        return create_memory_certificate(cache_to_disk=cache)
     else:
         return create_file_certificate()
 
-def create_memory_certificate():
-    """Create self-signed certificate in memory only - NO DISK TRACES"""
+def _cert_cache_passphrase():
+    """Passphrase protecting the cached key, or None (then nothing is cached)"""
+    passphrase = os.environ.get(CERT_CACHE_KEY_ENV)
+    return passphrase.encode('utf-8') if passphrase else None
+
+def load_cached_certificate(local_ip):
+    """Return cached (cert_pem, key_pem) if still valid for local_ip, else None"""
+    try:
+        from cryptography import x509
+        from cryptography.hazmat.primitives import serialization
+        import datetime
+        import ipaddress
+        import struct
+        
+        passphrase = _cert_cache_passphrase()
+        if passphrase is None:
+            return None
+        
+        blob = CERT_CACHE_FILE.read_bytes()
+        (cert_len,) = struct.unpack_from('>I', blob)
+        cert = x509.load_der_x509_certificate(blob[4:4 + cert_len])
+        private_key = serialization.load_der_private_key(blob[4 + cert_len:], password=passphrase)
+        
+        # Must stay valid for at least another day and match the current IP
+        not_valid_after = getattr(cert, 'not_valid_after_utc', None)
+        if not_valid_after is None:  # cryptography < 42
+            not_valid_after = cert.not_valid_after.replace(tzinfo=datetime.timezone.utc)
+        if not_valid_after < datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(days=1):
+            return None
+        san = cert.extensions.get_extension_for_class(x509.SubjectAlternativeName).value
+        if ipaddress.IPv4Address(local_ip) not in san.get_values_for_type(x509.IPAddress):
+            return None
+        
+        cert_pem = cert.public_bytes(serialization.Encoding.PEM).decode('utf-8')
+        key_pem = private_key.private_bytes(
+            encoding=serialization.Encoding.PEM,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.NoEncryption()
+        ).decode('utf-8')
+        return cert_pem, key_pem
+    except Exception:
+        return None
+
+def store_cached_certificate(cert, private_key):
+    """Save certificate and encrypted key (DER) to the user cache, readable by owner only"""
+    try:
+        from cryptography.hazmat.primitives import serialization
+        import struct
+        
+        passphrase = _cert_cache_passphrase()
+        if passphrase is None:
+            print(f"WARNING: Not caching certificate - set {CERT_CACHE_KEY_ENV} to enable")
+            return False
+        
+        cert_der = cert.public_bytes(serialization.Encoding.DER)
+        key_der = private_key.private_bytes(
+            encoding=serialization.Encoding.DER,
+            format=serialization.PrivateFormat.PKCS8,
+            encryption_algorithm=serialization.BestAvailableEncryption(passphrase)
+        )
+        CERT_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        fd = os.open(CERT_CACHE_FILE, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+        with os.fdopen(fd, 'wb') as f:
+            f.write(struct.pack('>I', len(cert_der)) + cert_der + key_der)
+        return True
+    except Exception as e:
+        print(f"WARNING: Could not cache certificate: {e}")
+        return False
+
+def create_memory_certificate(cache_to_disk=False):
+    """Create self-signed certificate in memory only - NO DISK TRACES
+    
+    With cache_to_disk the key pair is reused across restarts from
+    CERT_CACHE_FILE, skipping key generation while it is still valid.
+    """
+    # Get local IP
+    local_ip = get_local_ip()
+    
+    if cache_to_disk:
+        cached = load_cached_certificate(local_ip)
+        if cached:
+            print(f"Using cached certificate: {CERT_CACHE_FILE}")
+            print(f"Certificate valid for IP: {local_ip}")
+            return cached
+    
     print("Creating certificate in memory (no disk traces)...")
     
     try:
         from cryptography import x509
         from cryptography.x509.oid import NameOID
         from cryptography.hazmat.primitives import hashes, serialization
-        from cryptography.hazmat.primitives.asymmetric import rsa
+        from cryptography.hazmat.primitives.asymmetric import ec
         import datetime
         import ipaddress
         
@@ -93,14 +262,9 @@ def create_memory_certificate():
             return None, None
     
     try:
-        # Generate private key
-        private_key = rsa.generate_private_key(
-            public_exponent=65537,
-            key_size=2048
-        )
-        
-        # Get local IP
-        local_ip = get_local_ip()
+        # Generate private key (ECDSA P-256: keygen is near-instant, unlike
+        # RSA-2048's prime search, and accepted by all current browsers)
+        private_key = ec.generate_private_key(ec.SECP256R1())
         
         # Create certificate
         subject = issuer = x509.Name([
@@ -142,7 +306,10 @@ def create_memory_certificate():
         
         print(f"SUCCESS: Certificate created in memory")
         print(f"Certificate valid for IP: {local_ip}")
-        print("🔒 ZERO DISK TRACES - Maximum security")
+        if cache_to_disk and store_cached_certificate(cert, private_key):
+            print(f"Certificate cached for reuse: {CERT_CACHE_FILE}")
+        else:
+            print("🔒 ZERO DISK TRACES - Maximum security")
         
         # Return certificate and key as strings (MEMORY ONLY)
         return cert_pem, key_pem
@@ -156,7 +323,8 @@ def create_file_certificate():
     cert_file = "server.crt"
     key_file = "server.key"
     
-    if os.path.exists(cert_file) and os.path.exists(key_file):
+    entries = cwd_entries()
+    if cert_file in entries and key_file in entries:
         print(f"Using existing certificate: {cert_file}")
         return cert_file, key_file
     
@@ -166,7 +334,7 @@ def create_file_certificate():
         from cryptography import x509
         from cryptography.x509.oid import NameOID
         from cryptography.hazmat.primitives import hashes, serialization
-        from cryptography.hazmat.primitives.asymmetric import rsa
+        from cryptography.hazmat.primitives.asymmetric import ec
         import datetime
         import ipaddress
         
@@ -182,11 +350,8 @@ def create_file_certificate():
             return None, None
     
     try:
-        # Generate private key
-        private_key = rsa.generate_private_key(
-            public_exponent=65537,
-            key_size=2048
-        )
+        # Generate private key (ECDSA P-256, see create_memory_certificate)
+        private_key = ec.generate_private_key(ec.SECP256R1())
         
         # Get local IP
         local_ip = get_local_ip()
@@ -241,55 +406,166 @@ def create_file_certificate():
         print(f"ERROR creating certificate: {e}")
         return None, None
 
+def load_memory_certificate(context, cert_pem, key_pem):
+    """Load PEM certificate/key strings into an SSLContext without touching disk"""
+    # Python's ssl.load_cert_chain() only accepts paths. Where available,
+    # back those paths with anonymous memfd files so nothing is written to
+    # disk and there is no temp-file lifecycle to manage.
+    if hasattr(os, 'memfd_create') and os.path.isdir('/proc/self/fd'):
+        cert_fd = os.memfd_create('qr_cert', os.MFD_CLOEXEC)
+        key_fd = os.memfd_create('qr_key', os.MFD_CLOEXEC)
+        try:
+            os.write(cert_fd, cert_pem.encode('utf-8'))
+            os.write(key_fd, key_pem.encode('utf-8'))
+            context.load_cert_chain(f'/proc/self/fd/{cert_fd}', f'/proc/self/fd/{key_fd}')
+        finally:
+            os.close(cert_fd)
+            os.close(key_fd)
+        return
+
+    # SECURITY NOTE: elsewhere we fall back to temporary files that exist
+    # for milliseconds only - still much more secure than permanent files
+    import tempfile
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.crt', delete=False) as cert_tmp:
+        cert_tmp.write(cert_pem)
+        cert_tmp_name = cert_tmp.name
+    
+    with tempfile.NamedTemporaryFile(mode='w', suffix='.key', delete=False) as key_tmp:
+        key_tmp.write(key_pem)
+        key_tmp_name = key_tmp.name
+    
+    try:
+        context.load_cert_chain(cert_tmp_name, key_tmp_name)
+    finally:
+        # Immediately delete temporary files
+        try:
+            os.unlink(cert_tmp_name)
+            os.unlink(key_tmp_name)
+            print("🧹 Temporary certificate files deleted")
+        except:
+            pass
+
 class QRHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
     """Custom handler for QR receiver"""
-    
-    def do_GET(self):
-        """Handle GET requests"""
+
+    # Set TCP_NODELAY on each accepted connection so small TLS records and
+    # responses are not held back by Nagle's algorithm
+    disable_nagle_algorithm = True
+
+    # Set by main() from the receiver files found at startup; None means
+    # "not resolved yet" and makes do_GET check the filesystem itself
+    DEFAULT_PATH = '/qr_receiver_integrity.html'
+    ALTERNATIVES = None
+
+    # Headers identical on every response, pre-encoded once and appended to
+    # BaseHTTPRequestHandler's header buffer instead of via send_header()
+    _STATIC_HEADERS = b"".join(
+        f"{name}: {value}\r\n".encode('latin-1')
+        for name, value in RESPONSE_HEADERS.items()
+    )
+
+    # path -> (mtime_ns, size, bytes), least recently served first
+    _FILE_CACHE = OrderedDict()
+    _FILE_CACHE_BYTES = 0
+    _FILE_CACHE_LOCK = threading.Lock()  # Requests are handled on worker threads
+    # Larger files are streamed from disk instead of being cached
+    _FILE_CACHE_MAX_SIZE = 1 << 20
+    # Total cached bytes; least recently served files are evicted past this
+    _FILE_CACHE_MAX_TOTAL = 8 << 20
+
+    @classmethod
+    def _get_cached_file(cls, file_path):
+        """Return (size, bytes) for file_path; bytes is None if too large to cache"""
+        st = os.stat(file_path)
+        cache = cls._FILE_CACHE
+        with cls._FILE_CACHE_LOCK:
+            cached = cache.get(file_path)
+            if cached is not None and cached[0] == st.st_mtime_ns and cached[1] == st.st_size:
+                cache.move_to_end(file_path)
+                return st.st_size, cached[2]
+
+        if st.st_size > cls._FILE_CACHE_MAX_SIZE:
+            return st.st_size, None
+
+        with open(file_path, 'rb') as f:
+            data = f.read()
+        with cls._FILE_CACHE_LOCK:
+            previous = cache.pop(file_path, None)
+            if previous is not None:
+                cls._FILE_CACHE_BYTES -= len(previous[2])
+            cache[file_path] = (st.st_mtime_ns, st.st_size, data)
+            cls._FILE_CACHE_BYTES += len(data)
+            while cls._FILE_CACHE_BYTES > cls._FILE_CACHE_MAX_TOTAL:
+                _, (_, _, evicted) = cache.popitem(last=False)
+                cls._FILE_CACHE_BYTES -= len(evicted)
+        return st.st_size, data
+
+    def _send_static_headers(self):
+        """Append the pre-encoded RESPONSE_HEADERS in one go when possible"""
+        # _headers_buffer is BaseHTTPRequestHandler internals: it only exists
+        # once send_response() has started headers (never for HTTP/0.9)
+        headers_buffer = getattr(self, '_headers_buffer', None)
+        if headers_buffer is not None:
+            headers_buffer.append(self._STATIC_HEADERS)
+            return
+        for name, value in RESPONSE_HEADERS.items():
+            self.send_header(name, value)
+
+    @classmethod
+    def resolve_file_path(cls, url_path):
+        """Map a request path to the file to serve, or None if nothing fits"""
+        # Default to the best available receiver
+        if url_path == '/' or url_path == '/index.html':
+            url_path = cls.DEFAULT_PATH
+        
+        # Check if file exists; top-level names are a set lookup
+        file_path = url_path[1:]  # Remove leading '/'
+        if '/' in file_path:
+            if os.path.exists(file_path):
+                return file_path
+        else:
+            entries = cwd_entries()
+            if file_path in entries:
+                return file_path
+        
+        # Fall back to the receiver files resolved at startup
+        alternatives = cls.ALTERNATIVES
+        if alternatives is None:
+            entries = cwd_entries()
+            alternatives = [f for f in RECEIVER_FILES if f in entries]
         
-        # Default to the integrity receiver
-        if self.path == '/' or self.path == '/index.html':
-            self.path = '/qr_receiver_integrity.html'
+        if not alternatives:
+            return None
         
+        print(f"Serving: {alternatives[0]}")
+        return alternatives[0]
+
+    def do_GET(self):
+        """Handle GET requests"""
         try:
-            # Check if file exists
-            file_path = self.path[1:]  # Remove leading '/'
-            if not os.path.exists(file_path):
-                # Try common receiver files
-                alternatives = [
-                    'qr_receiver_integrity.html',
-                    'qr_receiver_nimiq.html', 
-                    'qr_receiver_advanced.html'
-                ]
-                
-                found = False
-                for alt in alternatives:
-                    if os.path.exists(alt):
-                        self.path = f'/{alt}'
-                        file_path = alt
-                        found = True
-                        print(f"Serving: {alt}")
-                        break
-                
-                if not found:
-                    available = [alt for alt in alternatives if os.path.exists(alt)]
-                    self.send_error(404, f"Receiver file not found. Available: {', '.join(available) if available else 'None'}")
-                    return
+            file_path = self.resolve_file_path(self.path)
+            if file_path is None:
+                self.send_error(404, "Receiver file not found. Available: None")
+                return
+            self.path = f'/{file_path}'
             
+            file_size, data = self._get_cached_file(file_path)
+
             # Add CORS headers for camera access
             self.send_response(200)
             self.send_header('Content-type', 'text/html' if self.path.endswith('.html') else 'application/octet-stream')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.send_header('Access-Control-Allow-Methods', 'GET, POST, OPTIONS')
-            self.send_header('Access-Control-Allow-Headers', 'Content-Type')
-            self.send_header('Cache-Control', 'no-cache, no-store, must-revalidate')
-            self.send_header('Pragma', 'no-cache')
-            self.send_header('Expires', '0')
+            self.send_header('Content-Length', str(file_size))
+            self._send_static_headers()
             self.end_headers()
-            
-            # Serve the file
+
+            if data is not None:
+                self.wfile.write(data)
+                return
+
+            # Stream the file in 64 KiB blocks; the socket is TLS-wrapped,
+            # so kernel sendfile() is not an option here
             with open(file_path, 'rb') as f:
-                self.wfile.write(f.read())
+                shutil.copyfileobj(f, self.wfile, 1 << 16)
                 
         except Exception as e:
             self.send_error(500, f"Error serving file: {str(e)}")
@@ -298,20 +574,53 @@ class QRHTTPRequestHandler(http.server.SimpleHTTPRequestHandler):
         """Custom logging"""
         print(f"[{self.address_string()}] {format % args}")
 
+def create_ssl_context(cert_file, key_file):
+    """Build the server SSLContext from file paths or in-memory PEM strings"""
+    context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    
+    # Handle memory certificates vs file certificates
+    config = load_config()
+    use_memory = config.get('security', {}).get('memory_certificates', False)
+    
+    if use_memory:
+        # Memory certificates - cert_file and key_file are strings
+        print("🔒 Loading certificates from memory (maximum security)")
+        
+        load_memory_certificate(context, cert_file, key_file)
+        print("✅ Memory certificates loaded successfully")
+    else:
+        # File certificates - cert_file and key_file are file paths
+        print("📁 Loading certificates from files")
+        context.load_cert_chain(cert_file, key_file)
+    
+    return context
+
+def run_aiohttp_server(context, port):
+    """Serve receiver files from a single asyncio event loop via aiohttp"""
+    async def handle(request):
+        file_path = QRHTTPRequestHandler.resolve_file_path(request.path)
+        if file_path is None:
+            raise web.HTTPNotFound(text="Receiver file not found. Available: None")
+        
+        headers = dict(RESPONSE_HEADERS)
+        headers['Content-Type'] = 'text/html' if file_path.endswith('.html') else 'application/octet-stream'
+        return web.FileResponse(file_path, headers=headers)
+    
+    app = web.Application()
+    app.router.add_get('/{tail:.*}', handle)
+    web.run_app(app, port=port, ssl_context=context, print=None)
+
 def main():
     PORT = 9443
     
     print("HTTPS SERVER FOR QR TRANSFER")
     print("=" * 50)
     
-    # Create certificate
-    cert_file, key_file = create_certificate()
-    if not cert_file or not key_file:
-        print("FAILED to create certificate. Exiting.")
-        print("\nTROUBLESHOOTING:")
-        print("1. Run: pip install cryptography")
-        print("2. Then run this server again")
-        return
+    # Create certificate in the background; key generation runs inside
+    # OpenSSL without the GIL, overlapping with the startup work below
+    cert_executor = ThreadPoolExecutor(max_workers=1)
+    cert_future = cert_executor.submit(create_certificate)
+    cert_executor.shutdown(wait=False)
     
     # Get local IP
     local_ip = get_local_ip()
@@ -340,67 +649,42 @@ def main():
     print("=" * 60)
     
     # Check for receiver files
-    receiver_files = [
-        'qr_receiver_integrity.html',
-        'qr_receiver_nimiq.html', 
-        'qr_receiver_advanced.html'
-    ]
-    
-    available_receivers = [f for f in receiver_files if os.path.exists(f)]
+    entries = cwd_entries()
+    available_receivers = [f for f in RECEIVER_FILES if f in entries]
     
     if not available_receivers:
         print("WARNING: No receiver HTML files found!")
-        print(f"Expected: {', '.join(receiver_files)}")
+        print(f"Expected: {', '.join(RECEIVER_FILES)}")
     else:
         print(f"Available receivers: {', '.join(available_receivers)}")
         print(f"Default server: {available_receivers[0]}")
+        QRHTTPRequestHandler.DEFAULT_PATH = '/' + available_receivers[0]
+    QRHTTPRequestHandler.ALTERNATIVES = tuple(available_receivers)
+    
+    cert_file, key_file = cert_future.result()
+    if not cert_file or not key_file:
+        print("FAILED to create certificate. Exiting.")
+        print("\nTROUBLESHOOTING:")
+        print("1. Run: pip install cryptography")
+        print("2. Then run this server again")
+        return
     
     try:
-        # Create server
-        with socketserver.TCPServer(("", PORT), QRHTTPRequestHandler) as httpd:
-            # Wrap with SSL
-            context = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
-            
-            # Handle memory certificates vs file certificates
-            config = load_config()
-            use_memory = config.get('security', {}).get('memory_certificates', False)
-            
-            if use_memory:
-                # Memory certificates - cert_file and key_file are strings
-                print("🔒 Loading certificates from memory (maximum security)")
-                
-                # Create temporary files in memory using io.StringIO
-                cert_io = io.StringIO(cert_file)  # cert_file is actually cert_pem string
-                key_io = io.StringIO(key_file)    # key_file is actually key_pem string
-                
-                # SECURITY NOTE: Python's ssl.load_cert_chain() requires file paths, not strings
-                # We use secure temporary files that exist for milliseconds only
-                # This is still much more secure than permanent certificate files
-                import tempfile
-                with tempfile.NamedTemporaryFile(mode='w', suffix='.crt', delete=False) as cert_tmp:
-                    cert_tmp.write(cert_file)
-                    cert_tmp_name = cert_tmp.name
-                
-                with tempfile.NamedTemporaryFile(mode='w', suffix='.key', delete=False) as key_tmp:
-                    key_tmp.write(key_file)
-                    key_tmp_name = key_tmp.name
-                
-                try:
-                    context.load_cert_chain(cert_tmp_name, key_tmp_name)
-                    print("✅ Memory certificates loaded successfully")
-                finally:
-                    # Immediately delete temporary files
-                    try:
-                        os.unlink(cert_tmp_name)
-                        os.unlink(key_tmp_name)
-                        print("🧹 Temporary certificate files deleted")
-                    except:
-                        pass
-            else:
-                # File certificates - cert_file and key_file are file paths
-                print("📁 Loading certificates from files")
-                context.load_cert_chain(cert_file, key_file)
+        # Wrap with SSL
+        context = create_ssl_context(cert_file, key_file)
+        
+        if web is not None:
+            print(f"\nSUCCESS: HTTPS server running! (aiohttp)")
+            print(f"Access at: https://{local_ip}:{PORT}")
+            print("Press Ctrl+C to stop")
+            print("\nWaiting for connections...")
             
+            run_aiohttp_server(context, PORT)
+            return
+        
+        # Create server
+        # Threaded so parallel asset fetches from the iPad do not queue up
+        with http.server.ThreadingHTTPServer(("", PORT), QRHTTPRequestHandler) as httpd:
             httpd.socket = context.wrap_socket(httpd.socket, server_side=True)
             
             print(f"\nSUCCESS: HTTPS server running!")
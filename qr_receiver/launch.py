@@ -11,9 +11,13 @@ import sys
 import os
 import subprocess
 import platform
-import urllib.request
+import importlib.util
+import threading
+import http.client
+import urllib.parse
 import tempfile
 import shutil
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 def check_python():
@@ -29,55 +33,71 @@ def check_pip():
     """Check if pip is available"""
     try:
         subprocess.run([sys.executable, '-m', 'pip', '--version'], 
-                      capture_output=True, check=True)
+                      stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
         print("✅ pip is available")
         return True
     except subprocess.CalledProcessError:
         print("❌ pip not found")
         return False
 
+def find_missing(deps):
+    """Return the requirements from {requirement: module} that are not importable"""
+    return [req for req, module in deps.items()
+            if importlib.util.find_spec(module) is None]
+
 def install_dependencies():
-    """Install required dependencies"""
+    """Install required dependencies that are not already available"""
     print("\n📦 Installing dependencies...")
     
-    # Core dependencies for basic functionality
-    core_deps = [
-        "aiohttp>=3.12.0",
-        "aiohttp-cors>=0.8.0", 
-        "segno>=1.6.0",
-        "pillow>=10.0.0"
-    ]
+    # Core dependencies for basic functionality (requirement -> import name)
+    core_deps = {
+        "aiohttp>=3.12.0": "aiohttp",
+        "aiohttp-cors>=0.8.0": "aiohttp_cors",
+        "segno>=1.6.0": "segno",
+        "pillow>=10.0.0": "PIL"
+    }
     
     # Optional dependencies for full features
-    optional_deps = [
-        "brotli>=1.1.0",
-        "zstandard>=0.24.0",
-        "lz4>=4.4.0",
-        "reedsolo>=1.7.0",
-        "cryptography>=41.0.0",
-        "psutil>=5.9.0"
-    ]
+    optional_deps = {
+        "brotli>=1.1.0": "brotli",
+        "zstandard>=0.24.0": "zstandard",
+        "lz4>=4.4.0": "lz4",
+        "reedsolo>=1.7.0": "reedsolo",
+        "cryptography>=41.0.0": "cryptography",
+        "psutil>=5.9.0": "psutil",
+        "pyyaml>=6.0": "yaml"       # binary wheels bundle the libyaml C loader
+    }
     
-    # Install core dependencies (required)
-    for dep in core_deps:
+    # Install missing core dependencies (required) in a single pip run
+    missing_core = find_missing(core_deps)
+    if missing_core:
         try:
-            print(f"   Installing {dep}...")
-            subprocess.run([sys.executable, '-m', 'pip', 'install', dep],
-                          capture_output=True, check=True)
+            print(f"   Installing {', '.join(missing_core)}...")
+            subprocess.run([sys.executable, '-m', 'pip', 'install', *missing_core],
+                          stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
         except subprocess.CalledProcessError as e:
-            print(f"❌ Failed to install {dep}")
+            print(f"❌ Failed to install core dependencies")
             return False
     
-    # Install optional dependencies (best effort)
-    optional_installed = 0
-    for dep in optional_deps:
+    # Install missing optional dependencies (best effort): try one batch
+    # first and only fall back to per-package installs if something fails
+    missing_optional = find_missing(optional_deps)
+    optional_installed = len(optional_deps) - len(missing_optional)
+    if missing_optional:
         try:
-            print(f"   Installing {dep}...")
-            subprocess.run([sys.executable, '-m', 'pip', 'install', dep],
-                          capture_output=True, check=True)
-            optional_installed += 1
+            print(f"   Installing {', '.join(missing_optional)}...")
+            subprocess.run([sys.executable, '-m', 'pip', 'install', *missing_optional],
+                          stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+            optional_installed = len(optional_deps)
         except subprocess.CalledProcessError:
-            print(f"⚠️  Could not install {dep} (optional)")
+            for dep in missing_optional:
+                try:
+                    print(f"   Installing {dep}...")
+                    subprocess.run([sys.executable, '-m', 'pip', 'install', dep],
+                                  stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL, check=True)
+                    optional_installed += 1
+                except subprocess.CalledProcessError:
+                    print(f"⚠️  Could not install {dep} (optional)")
     
     print(f"✅ Core dependencies installed")
     print(f"📊 Optional features: {optional_installed}/{len(optional_deps)} available")
@@ -109,19 +129,54 @@ def download_from_github():
     temp_dir = tempfile.mkdtemp(prefix="qr_receiver_")
     print(f"   Download location: {temp_dir}")
     
+    # One keep-alive HTTPS connection per worker thread, so the TCP/TLS
+    # handshake is paid once per worker rather than once per file
+    base = urllib.parse.urlsplit(base_url)
+    local = threading.local()
+    connections = []
+    
+    def get_connection():
+        conn = getattr(local, 'conn', None)
+        if conn is None:
+            conn = local.conn = http.client.HTTPSConnection(base.netloc, timeout=30)
+            connections.append(conn)
+        return conn
+    
+    def fetch(url_path, full_path):
+        conn = get_connection()
+        try:
+            conn.request('GET', url_path)
+            response = conn.getresponse()
+        except (http.client.HTTPException, OSError):
+            # Server may have dropped the idle connection; retry on a fresh one
+            conn.close()
+            conn.request('GET', url_path)
+            response = conn.getresponse()
+        
+        if response.status != 200:
+            response.read()
+            raise OSError(f"HTTP {response.status} {response.reason}")
+        
+        with open(full_path, 'wb') as fh:
+            shutil.copyfileobj(response, fh, 1 << 16)
+    
+    def download_file(file_path):
+        # Create directories if needed
+        full_path = Path(temp_dir) / file_path
+        full_path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Download file
+        try:
+            print(f"   Downloading {file_path}...")
+            fetch(f"{base.path}/{file_path}", full_path)
+        except Exception as e:
+            print(f"⚠️  Could not download {file_path}: {e}")
+    
     try:
-        for file_path in files_to_download:
-            # Create directories if needed
-            full_path = Path(temp_dir) / file_path
-            full_path.parent.mkdir(parents=True, exist_ok=True)
-            
-            # Download file
-            url = f"{base_url}/{file_path}"
-            try:
-                print(f"   Downloading {file_path}...")
-                urllib.request.urlretrieve(url, full_path)
-            except Exception as e:
-                print(f"⚠️  Could not download {file_path}: {e}")
+        # Downloads are latency-bound, so overlap them instead of paying
+        # one connection round-trip after another
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(download_file, files_to_download))
         
         print(f"✅ Downloaded to {temp_dir}")
         return temp_dir
@@ -130,6 +185,9 @@ def download_from_github():
         print(f"❌ Download failed: {e}")
         shutil.rmtree(temp_dir, ignore_errors=True)
         return None
+    finally:
+        for conn in connections:
+            conn.close()
 
 def launch_receiver(download_dir, host="localhost", port=8000):
     """Launch the QR receiver"""
@@ -7,17 +7,93 @@ Handles compression, encryption, and Reed-Solomon with elegant error recovery.
 """
 
 import asyncio
+import functools
 import hashlib
+import hmac
+import mmap
+import os
+import sys
 import time
-import io
 from enum import Enum
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Union, Any, Callable
+from typing import Dict, List, Optional, Union, Any, Awaitable, Callable
 from pathlib import Path
 import logging
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
 
 from ..core.config import QRReceiverConfig
 
+# __slots__-backed dataclasses where supported (Python 3.10+)
+DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Input block size for streaming decompression
+DECOMPRESS_BLOCK_SIZE = 1 << 20
+
+# Input block size for size-limited decoders without max_length (zstandard):
+# the limit is checked after each block, and 1 KiB of input can expand to at
+# most a few tens of MB, which bounds the overshoot
+UNBOUNDED_BLOCK_SIZE = 1 << 10
+
+# Size hints come from the sender (gzip ISIZE, frame headers, expected_size),
+# so the output buffer is only preallocated up to a small multiple of the
+# compressed input and a fixed cap; past that it grows as real output arrives
+DECOMPRESS_PREALLOC_RATIO = 4
+DECOMPRESS_PREALLOC_MAX = 64 << 20
+
+
+def _mmap_resize_supported() -> bool:
+    """mmap.resize needs mremap (Linux) or Windows; macOS/BSD raise SystemError"""
+    try:
+        probe = mmap.mmap(-1, mmap.PAGESIZE)
+        try:
+            probe.resize(2 * mmap.PAGESIZE)
+        finally:
+            probe.close()
+        return True
+    except (SystemError, OSError, ValueError):
+        return False
+
+
+# Without it, decompression writes into a bytearray and assemble_file
+# copies the result into an exactly-sized mapping of the destination
+MMAP_RESIZE_SUPPORTED = _mmap_resize_supported()
+
+# Buffers per os.writev call (POSIX IOV_MAX, 1024 on Linux)
+try:
+    IOV_MAX = os.sysconf("SC_IOV_MAX")
+except (AttributeError, ValueError, OSError):
+    IOV_MAX = -1
+if IOV_MAX <= 0:
+    IOV_MAX = 1024
+
+# AES-256-GCM payload layout: salt | nonce | ciphertext | tag
+AES_SALT_SIZE = 16
+AES_NONCE_SIZE = 12
+AES_TAG_SIZE = 16
+AES_KDF_ITERATIONS = 600_000
+
+# Reed-Solomon parity symbols per codeword when the sender doesn't say
+DEFAULT_RS_NSYM = 10
+
+# Below this much RS input, process spawn + pickling costs more than the
+# parallel decode saves, so small transfers decode in-process
+RS_PROCESS_POOL_MIN_SIZE = 512 * 1024
+
+
+@functools.lru_cache(maxsize=16)
+def _rs_codec(codec_class, nsym: int):
+    """RSCodec per (implementation, nsym) - builds the GF(256) tables once per process"""
+    return codec_class(nsym)
+
+
+def _rs_decode_batch(codec_class, nsym: int, batch: bytes):
+    """Decode a run of whole RS codewords (module-level so worker processes can pickle it)"""
+    decoded = _rs_codec(codec_class, nsym).decode(batch)
+    if isinstance(decoded, tuple):
+        # reedsolo >= 1.0 returns (message, message + ecc, errata positions)
+        return bytes(decoded[0]), len(decoded[2])
+    return bytes(decoded), 0
+
 
 class AssemblyState(Enum):
     """File assembly states"""
@@ -30,7 +106,7 @@ class AssemblyState(Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ChunkInfo:
     """
     Information about a received chunk
@@ -53,7 +129,7 @@ class ChunkInfo:
     rs_recovered_errors: int = 0
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class AssemblyProgress:
     """
     Progress tracking for Apple-inspired UI
@@ -91,9 +167,13 @@ class ChunkAssembler:
         
         # Progress tracking
         self.progress_callbacks: List[Callable[[AssemblyProgress], None]] = []
+        self._callback_is_async: Dict[Callable, bool] = {}  # Classified once per callback
+        self._done_future: Optional[asyncio.Future] = None  # Created on first use (needs a loop)
         
         # Compression support (matching qr_transfer)
-        self.compression_handlers = {}
+        self.compression_handlers: Dict[str, Callable[[bytes], bytes]] = {}
+        self.stream_decompressors: Dict[str, Callable[[], Any]] = {}
+        self.max_length_decompressors: set = set()  # decompress(data, max_length) supported
         self._initialize_compression_support()
         
         # Encryption support
@@ -104,6 +184,16 @@ class ChunkAssembler:
         self.reed_solomon_decoder = None
         self._initialize_reed_solomon_support()
         
+        # Shared pool for chunk hashing (hashlib releases the GIL)
+        self.hash_executor = ThreadPoolExecutor(max_workers=os.cpu_count())
+        
+        # Decompression runs off the event loop; one worker because codec
+        # contexts (e.g. the shared zstd dctx) aren't thread-safe
+        self.decompress_executor = ThreadPoolExecutor(max_workers=1)
+        
+        # Process pool for Reed-Solomon decoding (created on first use)
+        self.rs_executor: Optional[ProcessPoolExecutor] = None
+        
         # Statistics (air-gapped, memory-only)
         self.stats = {
             "files_assembled": 0,
@@ -115,7 +205,7 @@ class ChunkAssembler:
         }
         
         self.logger.info("🔧 Chunk Assembler initialized with Apple-inspired design")
-        self.logger.info(f"📦 Compression support: {list(self.compression_handlers.keys())}")
+        self.logger.info("📦 Compression support: %s", list(self.compression_handlers))
     
     def _setup_logging(self) -> logging.Logger:
         """Setup logging with appropriate level"""
@@ -131,66 +221,78 @@ class ChunkAssembler:
         return logger
     
     def _initialize_compression_support(self) -> None:
-        """Initialize compression handlers (matching qr_transfer)"""
+        """Initialize compression handlers (matching qr_transfer)
+        
+        Only available codecs are registered: compression_handlers maps
+        name -> one-shot decompress callable, stream_decompressors maps
+        name -> factory for an incremental decompressor object, and
+        max_length_decompressors names the ones whose decompress() takes
+        a max_length argument.
+        """
         try:
             # LZMA (highest compression)
             try:
                 import lzma
-                self.compression_handlers["lzma"] = {
-                    "decompress": lzma.decompress,
-                    "available": True
-                }
+                self.compression_handlers["lzma"] = lzma.decompress
+                self.stream_decompressors["lzma"] = lzma.LZMADecompressor
+                self.max_length_decompressors.add("lzma")
             except ImportError:
-                self.compression_handlers["lzma"] = {"available": False}
+                pass
             
             # Brotli (Google's algorithm)
             try:
                 import brotli
-                self.compression_handlers["brotli"] = {
-                    "decompress": brotli.decompress,
-                    "available": True
-                }
+                self.compression_handlers["brotli"] = brotli.decompress
             except ImportError:
-                self.compression_handlers["brotli"] = {"available": False}
+                pass
             
             # Zstandard (Facebook's algorithm)
             try:
                 import zstandard as zstd
-                self.compression_handlers["zstandard"] = {
-                    "decompress": lambda data: zstd.ZstdDecompressor().decompress(data),
-                    "available": True
-                }
+                # One context reused for every file (keeps its window buffer)
+                self._zstd_dctx = zstd.ZstdDecompressor()
+                self.compression_handlers["zstandard"] = self._zstd_dctx.decompress
+                self.stream_decompressors["zstandard"] = self._zstd_dctx.decompressobj
             except ImportError:
-                self.compression_handlers["zstandard"] = {"available": False}
+                pass
             
             # LZ4 (fastest)
             try:
                 import lz4.frame
-                self.compression_handlers["lz4"] = {
-                    "decompress": lz4.frame.decompress,
-                    "available": True
-                }
+                self.compression_handlers["lz4"] = lz4.frame.decompress
+                self.stream_decompressors["lz4"] = lz4.frame.LZ4FrameDecompressor
+                self.max_length_decompressors.add("lz4")
             except ImportError:
-                self.compression_handlers["lz4"] = {"available": False}
+                pass
             
             # Standard library algorithms
             import gzip
             import bz2
             
+            # Prefer faster zlib-compatible backends for gzip
+            try:
+                from isal import igzip as gzip_backend, isal_zlib as zlib_backend
+                gzip_name = "isal"
+            except ImportError:
+                try:
+                    from zlib_ng import gzip_ng as gzip_backend, zlib_ng as zlib_backend
+                    gzip_name = "zlib-ng"
+                except ImportError:
+                    import zlib as zlib_backend
+                    gzip_backend = gzip
+                    gzip_name = "zlib"
+            self.logger.debug("📦 gzip backend: %s", gzip_name)
+            
             self.compression_handlers.update({
-                "gzip": {
-                    "decompress": gzip.decompress,
-                    "available": True
-                },
-                "bz2": {
-                    "decompress": bz2.decompress,
-                    "available": True
-                },
-                "store": {
-                    "decompress": lambda data: data,  # No compression
-                    "available": True
-                }
+                "gzip": gzip_backend.decompress,
+                "bz2": bz2.decompress,
+                "store": lambda data: data  # No compression
+            })
+            self.stream_decompressors.update({
+                "gzip": lambda: zlib_backend.decompressobj(wbits=31),  # gzip container
+                "bz2": bz2.BZ2Decompressor
             })
+            self.max_length_decompressors.update(("gzip", "bz2"))
             
         except Exception as e:
             self.logger.warning(f"⚠️  Compression initialization warning: {e}")
@@ -225,8 +327,12 @@ class ChunkAssembler:
         try:
             if self.config.reed_solomon_enabled:
                 try:
-                    import reedsolo
-                    self.reed_solomon_decoder = reedsolo.RSCodec
+                    # Prefer the compiled extension (same API, much faster)
+                    try:
+                        from creedsolo import RSCodec
+                    except ImportError:
+                        from reedsolo import RSCodec
+                    self.reed_solomon_decoder = RSCodec(DEFAULT_RS_NSYM)
                     self.logger.info("🛡️  Reed-Solomon error correction enabled")
                 except ImportError:
                     self.logger.warning("⚠️  Reed-Solomon library not available")
@@ -235,12 +341,14 @@ class ChunkAssembler:
         except Exception as e:
             self.logger.warning(f"⚠️  Reed-Solomon initialization warning: {e}")
     
-    async def assemble_file(self, session) -> Optional[bytes]:
+    async def assemble_file(self, session, dest_path: Optional[Path] = None) -> Optional[Union[bytes, mmap.mmap]]:
         """
         Assemble complete file from chunks with Apple-style progress tracking
         
         Args:
             session: ReceptionSession with received chunks
+            dest_path: Optional file to assemble into; the result is then a
+                writable mmap of that file instead of an in-memory buffer
             
         Returns:
             Complete file data or None if assembly failed
@@ -253,26 +361,41 @@ class ChunkAssembler:
         )
         
         try:
-            self.logger.info(f"🔧 Assembling file: {session.filename}")
+            self.logger.info("🔧 Assembling file: %s", session.filename)
             await self._notify_progress(progress)
             
+            # Without later stages the chunks can go straight into the destination file
+            compressed = session.compression_algorithm and session.compression_algorithm != "store"
+            rs_active = session.reed_solomon_enabled and self.reed_solomon_decoder
+            direct = dest_path is not None and not (compressed or rs_active or session.encryption_enabled)
+            
+            # Compressed-only transfers feed chunks straight to the streaming
+            # decompressor while their hashes are checked alongside
+            pipelined = (compressed and not rs_active and not session.encryption_enabled
+                         and session.compression_algorithm in self.stream_decompressors)
+            hash_check = None
+            
             # Validate chunks
-            if not await self._validate_chunks(session, progress):
+            if not await self._validate_chunks(session, progress, check_hashes=not pipelined):
                 progress.state = AssemblyState.FAILED
                 progress.errors.append("Chunk validation failed")
                 await self._notify_progress(progress)
                 return None
             
-            # Sort and assemble chunks
-            progress.current_operation = "Assembling chunks"
-            await self._notify_progress(progress)
-            
-            assembled_data = await self._assemble_chunks(session, progress)
-            if not assembled_data:
-                progress.state = AssemblyState.FAILED
-                progress.errors.append("Chunk assembly failed")
+            if pipelined:
+                assembled_data = [chunk_info.data for chunk_info in session.ordered_chunks]
+                hash_check = asyncio.ensure_future(self._check_chunk_hashes(session, progress))
+            else:
+                # Sort and assemble chunks
+                progress.current_operation = "Assembling chunks"
                 await self._notify_progress(progress)
-                return None
+                
+                assembled_data = await self._assemble_chunks(session, progress, dest_path if direct else None)
+                if not assembled_data:
+                    progress.state = AssemblyState.FAILED
+                    progress.errors.append("Chunk assembly failed")
+                    await self._notify_progress(progress)
+                    return None
             
             # Apply Reed-Solomon error correction if enabled
             if session.reed_solomon_enabled and self.reed_solomon_decoder:
@@ -301,18 +424,28 @@ class ChunkAssembler:
                     return None
             
             # Decompress if compressed
-            if session.compression_algorithm and session.compression_algorithm != "store":
+            if compressed:
                 progress.state = AssemblyState.DECOMPRESSING
                 progress.current_operation = f"Decompressing ({session.compression_algorithm})"
                 await self._notify_progress(progress)
                 
-                assembled_data = await self._decompress_data(assembled_data, session, progress)
+                try:
+                    assembled_data = await self._decompress_data(assembled_data, session, progress, dest_path)
+                finally:
+                    if hash_check is not None:
+                        await hash_check
                 if not assembled_data:
                     progress.state = AssemblyState.FAILED
                     progress.errors.append("Decompression failed")
                     await self._notify_progress(progress)
                     return None
             
+            # Spill RS/decrypt output that never touched the destination file
+            if dest_path is not None and not isinstance(assembled_data, mmap.mmap):
+                mapped = self._map_output(dest_path, len(assembled_data))
+                mapped[:] = assembled_data
+                assembled_data = mapped
+            
             # Final verification
             progress.state = AssemblyState.VERIFYING
             progress.current_operation = "Final verification"
@@ -328,7 +461,7 @@ class ChunkAssembler:
             progress.current_operation = "Assembly complete"
             await self._notify_progress(progress)
             
-            self.logger.info(f"✅ File assembled successfully: {len(assembled_data)} bytes")
+            self.logger.info("✅ File assembled successfully: %d bytes", len(assembled_data))
             return assembled_data
             
         except Exception as e:
@@ -338,99 +471,156 @@ class ChunkAssembler:
             await self._notify_progress(progress)
             return None
     
-    async def _validate_chunks(self, session, progress: AssemblyProgress) -> bool:
+    async def _validate_chunks(self, session, progress: AssemblyProgress, check_hashes: bool = True) -> bool:
         """Validate all chunks are present and intact"""
-        try:
-            progress.current_operation = "Validating chunks"
-            await self._notify_progress(progress)
-            
-            # Check chunk count
-            expected_chunks = session.total_chunks
-            received_chunks = len(session.received_chunks)
-            
-            if received_chunks != expected_chunks:
-                self.logger.error(f"❌ Missing chunks: {received_chunks}/{expected_chunks}")
-                return False
-            
-            # Check for gaps
-            chunk_indices = set(session.received_chunks.keys())
-            expected_indices = set(range(expected_chunks))
-            missing = expected_indices - chunk_indices
-            
-            if missing:
-                self.logger.error(f"❌ Missing chunk indices: {sorted(missing)}")
-                return False
-            
-            # Validate chunk integrity
-            invalid_chunks = []
-            for index, chunk_info in session.received_chunks.items():
-                if not await self._validate_chunk_integrity(chunk_info):
-                    invalid_chunks.append(index)
-            
-            if invalid_chunks:
-                self.logger.error(f"❌ Invalid chunks: {invalid_chunks}")
-                progress.warnings.append(f"Integrity issues in chunks: {invalid_chunks}")
-                # Continue anyway - Reed-Solomon might fix this
-            
-            self.logger.debug(f"✅ Chunk validation complete: {received_chunks} chunks")
-            return True
+        progress.current_operation = "Validating chunks"
+        await self._notify_progress(progress)
+        
+        # Check chunk count and gaps against the session's received bitmask
+        expected_chunks = session.total_chunks
+        full_mask = (1 << expected_chunks) - 1
+        missing = full_mask & ~session.received_mask
+        
+        if missing:
+            received_chunks = bin(session.received_mask & full_mask).count("1")
+            self.logger.error(f"❌ Missing chunks: {received_chunks}/{expected_chunks}")
             
-        except Exception as e:
-            self.logger.error(f"❌ Chunk validation error: {e}")
+            # Listing every gap is costly for large sessions - debug only
+            if self.logger.isEnabledFor(logging.DEBUG):
+                missing_indices = []
+                while missing:
+                    lowest = missing & -missing
+                    missing_indices.append(lowest.bit_length() - 1)
+                    missing ^= lowest
+                self.logger.debug("❌ Missing chunk indices: %s", missing_indices)
             return False
+        
+        if check_hashes:
+            await self._check_chunk_hashes(session, progress)
+        
+        self.logger.debug("✅ Chunk validation complete: %d chunks", expected_chunks)
+        return True
     
-    async def _validate_chunk_integrity(self, chunk_info: ChunkInfo) -> bool:
-        """Validate individual chunk integrity"""
+    async def _check_chunk_hashes(self, session, progress: AssemblyProgress) -> None:
+        """Hash every chunk on the hash executor and record integrity warnings"""
+        # Chunks the engine already verified on arrival don't need a second pass
+        pending = [chunk_info for chunk_info in session.received_chunks.values() if not chunk_info.verified]
+        
+        # hashlib releases the GIL, so hash in parallel
+        loop = asyncio.get_running_loop()
+        results = await asyncio.gather(*[
+            loop.run_in_executor(self.hash_executor, self._validate_chunk_integrity, chunk_info)
+            for chunk_info in pending
+        ])
+        invalid_chunks = [chunk_info.index for chunk_info, valid in zip(pending, results) if not valid]
+        
+        if invalid_chunks:
+            self.logger.error(f"❌ Invalid chunks: {invalid_chunks}")
+            progress.warnings.append(f"Integrity issues in chunks: {invalid_chunks}")
+            # Continue anyway - Reed-Solomon might fix this
+    
+    def _validate_chunk_integrity(self, chunk_info: ChunkInfo) -> bool:
+        """Validate individual chunk integrity (runs on the hash executor)"""
+        if not chunk_info.hash:
+            return True  # No hash to verify
+        
+        # Calculate actual hash
+        actual_hash = hashlib.sha256(chunk_info.data).digest()
+        
+        # Compare binary digests in constant time (handle truncated hashes)
+        expected = chunk_info.hash
         try:
-            if not chunk_info.hash:
-                return True  # No hash to verify
-            
-            # Calculate actual hash
-            actual_hash = hashlib.sha256(chunk_info.data).hexdigest()
-            
-            # Compare with expected (handle truncated hashes)
-            expected = chunk_info.hash
-            if len(expected) < len(actual_hash):
-                actual_short = actual_hash[:len(expected)]
-                return actual_short.lower() == expected.lower()
-            else:
-                return actual_hash.lower() == expected.lower()
-                
-        except Exception as e:
-            self.logger.debug(f"🔍 Chunk integrity check error: {e}")
+            if len(expected) % 2:
+                # Odd-length prefix can't be decoded to bytes
+                return hmac.compare_digest(actual_hash.hex()[:len(expected)], expected.lower())
+            expected_bytes = bytes.fromhex(expected)
+        except (ValueError, TypeError) as e:
+            self.logger.debug("🔍 Malformed chunk hash: %s", e)
             return False
+        return hmac.compare_digest(actual_hash[:len(expected_bytes)], expected_bytes)
+    
+    async def _assemble_chunks(self, session, progress: AssemblyProgress,
+                               dest_path: Optional[Path] = None) -> Optional[Union[bytearray, mmap.mmap]]:
+        """Assemble chunks in correct order (into a mapping of dest_path if given)"""
+        # Chunks in index order (validation guarantees every slot is filled)
+        chunks = [chunk_info.data for chunk_info in session.ordered_chunks]
+        chunk_count = len(chunks)
+
+        # Preallocate the whole file once; expected_size is the original
+        # (pre-compression) size, so size the buffer from the chunks themselves
+        total_size = sum(map(len, chunks))
+        if dest_path is not None and hasattr(os, "writev"):
+            return await self._write_chunks(dest_path, chunks, total_size, progress)
+        if dest_path is not None:
+            assembled = self._map_output(dest_path, total_size)
+        else:
+            assembled = bytearray(total_size)
+        view = memoryview(assembled)
+        offset = 0
+
+        # Notify once per whole percent and yield only after ~10ms of work
+        next_notify_pct = 0
+        last_yield = time.monotonic()
+        pct = 0.0
+        step = 30.0 / chunk_count  # 30% for assembly
+        notify_progress = self._notify_progress
+
+        for data in chunks:
+            # Update progress
+            if pct >= next_notify_pct:
+                progress.progress_percentage = pct
+                progress.bytes_processed = offset
+                await notify_progress(progress)
+                next_notify_pct = int(pct) + 1
+            pct += step
+
+            # Copy chunk data into place
+            end = offset + len(data)
+            view[offset:end] = data
+            offset = end
+
+            # Yield control periodically
+            if time.monotonic() - last_yield > 0.01:
+                await asyncio.sleep(0)  # Allow other tasks
+                last_yield = time.monotonic()
+
+        view.release()
+        self.logger.debug("📦 Assembled %d bytes from %d chunks", total_size, chunk_count)
+
+        return assembled
     
-    async def _assemble_chunks(self, session, progress: AssemblyProgress) -> Optional[bytes]:
-        """Assemble chunks in correct order"""
+    async def _write_chunks(self, dest_path: Path, chunks: List[bytes], total_size: int,
+                            progress: AssemblyProgress) -> mmap.mmap:
+        """Gather-write ordered chunks to dest_path with os.writev, then map the file"""
+        fd = os.open(dest_path, os.O_RDWR | os.O_CREAT | os.O_TRUNC, 0o644)
         try:
-            assembled = io.BytesIO()
-            total_size = 0
-            
-            # Sort chunks by index
-            sorted_chunks = sorted(session.received_chunks.items())
+            chunk_count = len(chunks)
+            offset = 0
             
-            for i, (index, chunk_info) in enumerate(sorted_chunks):
-                # Update progress
-                progress.progress_percentage = (i / len(sorted_chunks)) * 30  # 30% for assembly
-                progress.bytes_processed = total_size
-                await self._notify_progress(progress)
-                
-                # Write chunk data
-                assembled.write(chunk_info.data)
-                total_size += len(chunk_info.data)
+            for start in range(0, chunk_count, IOV_MAX):
+                batch = chunks[start:start + IOV_MAX]
+                batch_size = sum(map(len, batch))
+                written = os.writev(fd, batch)
+                if written < batch_size:
+                    # Short write - finish the batch with plain writes
+                    rest = memoryview(b"".join(batch))[written:]
+                    while rest:
+                        rest = rest[os.write(fd, rest):]
+                offset += batch_size
                 
-                # Yield control periodically
-                if i % 10 == 0:
-                    await asyncio.sleep(0.001)  # Allow other tasks
-            
-            assembled_data = assembled.getvalue()
-            self.logger.debug(f"📦 Assembled {len(assembled_data)} bytes from {len(sorted_chunks)} chunks")
+                # Update progress (one notification per batch)
+                progress.progress_percentage = (start + len(batch)) * 30.0 / chunk_count  # 30% for assembly
+                progress.bytes_processed = offset
+                await self._notify_progress(progress)
+                await asyncio.sleep(0)  # Allow other tasks
             
-            return assembled_data
+            self.logger.debug("📦 Wrote %d bytes from %d chunks to %s", total_size, chunk_count, dest_path)
             
-        except Exception as e:
-            self.logger.error(f"❌ Chunk assembly error: {e}")
-            return None
+            if not total_size:
+                os.ftruncate(fd, 1)  # mmap can't map an empty file
+            return mmap.mmap(fd, max(1, total_size))
+        finally:
+            os.close(fd)
     
     async def _apply_reed_solomon_correction(self, data: bytes, session, progress: AssemblyProgress) -> Optional[bytes]:
         """Apply Reed-Solomon error correction"""
@@ -443,22 +633,51 @@ class ChunkAssembler:
             await self._notify_progress(progress)
             
             # Apply Reed-Solomon correction
-            # This is a simplified implementation - actual RS needs metadata
             try:
-                # Create decoder with appropriate parameters
-                rs_decoder = self.reed_solomon_decoder(session.reed_solomon_blocks or 10)
+                # Cached codec per nsym (GF tables are built once per process)
+                nsym = session.reed_solomon_blocks or DEFAULT_RS_NSYM
+                codec_class = type(self.reed_solomon_decoder)
+                rs_decoder = _rs_codec(codec_class, nsym)
+                
+                # Split on codeword boundaries into one batch per worker
+                nsize = rs_decoder.nsize
+                codewords = -(-len(data) // nsize)
+                workers = (os.cpu_count() or 1) if len(data) >= RS_PROCESS_POOL_MIN_SIZE else 1
+                batch_size = -(-codewords // workers) * nsize
+                view = memoryview(data)
+                batches = [bytes(view[i:i + batch_size]) for i in range(0, len(view), batch_size)]
+                view.release()
                 
-                # Decode with error correction
-                corrected_data = rs_decoder.decode(data)
+                # Decode batches in separate processes (pure-Python reedsolo holds the GIL)
+                if len(batches) > 1:
+                    if self.rs_executor is None:
+                        self.rs_executor = ProcessPoolExecutor(max_workers=workers)
+                    loop = asyncio.get_running_loop()
+                    results = await asyncio.gather(*[
+                        loop.run_in_executor(self.rs_executor, _rs_decode_batch, codec_class, nsym, batch)
+                        for batch in batches
+                    ])
+                else:
+                    results = [_rs_decode_batch(codec_class, nsym, batch) for batch in batches]
+                
+                # Copy each batch into one buffer sized from the codeword layout
+                full_codewords, tail = divmod(len(data), nsize)
+                corrected_data = bytearray(full_codewords * (nsize - nsym) + max(0, tail - nsym))
+                offset = 0
+                for decoded, _ in results:
+                    end = offset + len(decoded)
+                    corrected_data[offset:end] = decoded
+                    offset = end
+                del corrected_data[offset:]  # No-op unless the codec disagreed on sizes
                 
                 # Count corrections
-                corrections = len(data) - len(corrected_data)
+                corrections = sum(errata for _, errata in results)
                 if corrections > 0:
                     self.stats["reed_solomon_corrections"] += corrections
-                    self.logger.info(f"🛡️  Reed-Solomon corrected {corrections} errors")
+                    self.logger.info("🛡️  Reed-Solomon corrected %d errors", corrections)
                     progress.warnings.append(f"Corrected {corrections} transmission errors")
                 
-                return bytes(corrected_data)
+                return corrected_data
                 
             except Exception as rs_error:
                 self.logger.warning(f"⚠️  Reed-Solomon correction failed: {rs_error}")
@@ -476,51 +695,127 @@ class ChunkAssembler:
                 self.logger.error("❌ AES-256 decryption not available")
                 return None
             
-            progress.current_operation = "AES-256 decryption"
-            await self._notify_progress(progress)
+            if not self.config.encryption_password:
+                self.logger.error("❌ No encryption password configured")
+                return None
             
-            # This is a placeholder - actual decryption needs key management
-            # In a real implementation, you'd need:
-            # 1. Key derivation from password/passphrase
-            # 2. IV extraction from data
-            # 3. Actual decryption
+            if len(data) < AES_SALT_SIZE + AES_NONCE_SIZE + AES_TAG_SIZE:
+                self.logger.error("❌ Encrypted payload too short")
+                return None
             
-            self.logger.warning("⚠️  Decryption not fully implemented - returning raw data")
-            progress.warnings.append("Decryption not implemented - data may be encrypted")
+            progress.current_operation = "AES-256 decryption"
+            await self._notify_progress(progress)
             
-            return data
+            # Key derivation and AES-GCM both release the GIL - keep them off the loop
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self._aes_gcm_decrypt, data, session)
             
         except Exception as e:
             self.logger.error(f"❌ Decryption error: {e}")
             return None
     
-    async def _decompress_data(self, data: bytes, session, progress: AssemblyProgress) -> Optional[bytes]:
+    def _aes_gcm_decrypt(self, data, session) -> bytearray:
+        """Decrypt an AES-256-GCM payload (OpenSSL EVP picks up AES-NI/ARMv8 CE)"""
+        handler = self.encryption_handlers["aes-256"]
+        view = memoryview(data)
+        salt = bytes(view[:AES_SALT_SIZE])
+        nonce = bytes(view[AES_SALT_SIZE:AES_SALT_SIZE + AES_NONCE_SIZE])
+        tag = bytes(view[-AES_TAG_SIZE:])
+        ciphertext = view[AES_SALT_SIZE + AES_NONCE_SIZE:-AES_TAG_SIZE]
+        
+        # Derive the key once per session
+        cached = session.decryption_key
+        if cached and cached[0] == salt:
+            key = cached[1]
+        else:
+            kdf = handler["kdf"](
+                algorithm=handler["hashes"].SHA256(),
+                length=32,
+                salt=salt,
+                iterations=AES_KDF_ITERATIONS
+            )
+            key = kdf.derive(self.config.encryption_password.encode())
+            session.decryption_key = (salt, key)
+        
+        decryptor = handler["cipher"](
+            handler["algorithms"].AES(key),
+            handler["modes"].GCM(nonce, tag)
+        ).decryptor()
+        
+        # Decrypt straight into the output buffer (update_into needs block_size - 1 spare bytes)
+        plaintext = bytearray(len(ciphertext) + 15)
+        written = decryptor.update_into(ciphertext, plaintext)
+        decryptor.finalize()  # Raises InvalidTag if the data was tampered with
+        del plaintext[written:]
+        view.release()
+        return plaintext
+    
+    async def _decompress_data(self, data: bytes, session, progress: AssemblyProgress,
+                               dest_path: Optional[Path] = None) -> Optional[bytes]:
         """Decompress data using specified algorithm"""
         try:
             algorithm = session.compression_algorithm
             
-            if algorithm not in self.compression_handlers:
-                self.logger.error(f"❌ Unsupported compression: {algorithm}")
+            decompress = self.compression_handlers.get(algorithm)
+            if decompress is None:
+                if algorithm in self.config.supported_compression:
+                    self.logger.error(f"❌ Compression handler not available: {algorithm}")
+                else:
+                    self.logger.error(f"❌ Unsupported compression: {algorithm}")
                 return None
             
-            handler = self.compression_handlers[algorithm]
-            if not handler["available"]:
-                self.logger.error(f"❌ Compression handler not available: {algorithm}")
+            # Pipelined callers pass the ordered chunk list instead of one buffer
+            if isinstance(data, list):
+                original_size = sum(map(len, data))
+                head = bytes(data[0][:32]) if data else b""
+                tail = b"".join(data[-4:])[-4:]
+            else:
+                original_size = len(data)
+                head = bytes(data[:32])
+                tail = bytes(data[-4:])
+            
+            # Refuse decompression bombs up front when the container records its size
+            limit = self.config.max_decompressed_size or None
+            size_hint = self._peek_decompressed_size(algorithm, head, tail)
+            if limit and size_hint and size_hint > limit:
+                self.logger.error(f"❌ Decompressed size {size_hint} exceeds limit {limit}")
                 return None
+            size_hint = size_hint or session.expected_size or 0
+            if limit:
+                size_hint = min(size_hint, limit)
+            size_hint = min(size_hint, original_size * DECOMPRESS_PREALLOC_RATIO, DECOMPRESS_PREALLOC_MAX)
             
             progress.current_operation = f"Decompressing with {algorithm}"
             await self._notify_progress(progress)
             
-            # Decompress data
-            original_size = len(data)
-            decompressed_data = handler["decompress"](data)
+            # Decompress data (streamed in blocks when the codec supports it) off the event loop
+            loop = asyncio.get_running_loop()
+            stream_factory = self.stream_decompressors.get(algorithm)
+            if stream_factory is not None:
+                output = None
+                if dest_path is not None and MMAP_RESIZE_SUPPORTED:
+                    output = self._map_output(dest_path, size_hint)
+                decompressed_data = await loop.run_in_executor(
+                    self.decompress_executor, self._stream_decompress,
+                    stream_factory, data, size_hint, output, limit,
+                    algorithm in self.max_length_decompressors
+                )
+            else:
+                if isinstance(data, list):
+                    data = b"".join(data)
+                decompressed_data = await loop.run_in_executor(self.decompress_executor, decompress, data)
             decompressed_size = len(decompressed_data)
             
+            if limit and decompressed_size > limit:
+                self.logger.error(f"❌ Decompressed size {decompressed_size} exceeds limit {limit}")
+                return None
+            
             # Calculate compression ratio
             compression_ratio = (original_size / max(1, decompressed_size)) * 100
             self.stats["compression_savings"] += compression_ratio
             
-            self.logger.info(f"📦 Decompressed: {original_size} → {decompressed_size} bytes ({compression_ratio:.1f}% compression)")
+            self.logger.info("📦 Decompressed: %d → %d bytes (%.1f%% compression)",
+                             original_size, decompressed_size, compression_ratio)
             
             return decompressed_data
             
@@ -528,6 +823,107 @@ class ChunkAssembler:
             self.logger.error(f"❌ Decompression error: {e}")
             return None
     
+    def _stream_decompress(self, factory: Callable[[], Any], data, size_hint: int,
+                           output: Optional[mmap.mmap] = None,
+                           limit: Optional[int] = None,
+                           max_length: bool = False) -> Union[bytearray, mmap.mmap]:
+        """Decompress in fixed-size blocks into a buffer preallocated from size_hint
+        
+        data is either one buffer (read in DECOMPRESS_BLOCK_SIZE blocks) or a
+        list of ordered chunks fed as-is. With a limit, decoders flagged as
+        taking max_length (zlib, lzma, bz2, lz4) never produce more than
+        limit + 1 bytes; others (zstandard) are fed UNBOUNDED_BLOCK_SIZE
+        blocks and checked after each one.
+        """
+        bounded = limit is not None and max_length
+        step = UNBOUNDED_BLOCK_SIZE if limit is not None and not max_length else DECOMPRESS_BLOCK_SIZE
+        if isinstance(data, list):
+            view = None
+            blocks = data
+            if step < DECOMPRESS_BLOCK_SIZE:
+                blocks = [chunk[i:i + step] for chunk in data for i in range(0, len(chunk), step)]
+        else:
+            view = memoryview(data)
+            blocks = [view[i:i + step] for i in range(0, len(view), step)]
+        if output is None:
+            output = bytearray(max(0, size_hint or 0))
+        mapped = isinstance(output, mmap.mmap)
+        position = 0
+        decompressor = factory()
+        
+        for block in blocks:
+            while block is not None:
+                # Concatenated streams/members need a fresh decompressor each
+                if decompressor.eof:
+                    decompressor = factory()
+                if bounded:
+                    piece = decompressor.decompress(block, limit - position + 1)
+                else:
+                    piece = decompressor.decompress(block)
+                end = position + len(piece)
+                if limit is not None and end > limit:
+                    raise ValueError(f"Decompressed data exceeds {limit} bytes")
+                if mapped and end > len(output):
+                    output.resize(max(end, len(output) * 2))
+                output[position:end] = piece  # grows a bytearray if the hint was short
+                position = end
+                
+                if decompressor.eof:
+                    block = decompressor.unused_data or None
+                elif getattr(decompressor, "unconsumed_tail", None):
+                    block = decompressor.unconsumed_tail  # zlib stopped at max_length
+                elif not getattr(decompressor, "needs_input", True):
+                    block = b""  # Output still buffered inside the decompressor
+                else:
+                    block = None
+        
+        flush = getattr(decompressor, "flush", None)
+        if flush:
+            piece = flush()
+            end = position + len(piece)
+            if mapped and end > len(output):
+                output.resize(end)
+            output[position:end] = piece
+            position = end
+        
+        if not decompressor.eof:
+            raise EOFError("Compressed data ended before the end-of-stream marker")
+        
+        if mapped:
+            if position:
+                output.resize(position)
+        else:
+            del output[position:]
+        if view is not None:
+            for block in blocks:
+                block.release()
+            view.release()
+        return output
+    
+    def _peek_decompressed_size(self, algorithm: str, head: bytes, tail: bytes) -> Optional[int]:
+        """Decompressed size recorded in the container header/trailer, if any"""
+        try:
+            if algorithm == "zstandard":
+                import zstandard as zstd
+                size = zstd.frame_content_size(head)
+                return size if size >= 0 else None
+            if algorithm == "lz4":
+                import lz4.frame
+                return lz4.frame.get_frame_info(head)["content_size"] or None
+            if algorithm == "gzip" and head[:2] == b"\x1f\x8b" and len(tail) == 4:
+                # ISIZE trailer: last member's size mod 2**32
+                return int.from_bytes(tail, "little") or None
+        except Exception as e:
+            self.logger.debug("🔍 Size peek failed: %s", e)  # Only a hint
+        return None
+    
+    def _map_output(self, dest_path: Path, size: int) -> mmap.mmap:
+        """Create dest_path with the given size and map it writable"""
+        size = max(1, size)  # mmap can't map an empty file
+        with open(dest_path, "w+b") as f:
+            f.truncate(size)
+            return mmap.mmap(f.fileno(), size)
+    
     def _update_assembly_stats(self, session, assembled_data: bytes, progress: AssemblyProgress) -> None:
         """Update assembly statistics"""
         try:
@@ -548,32 +944,63 @@ class ChunkAssembler:
                         ((current_avg * (files_count - 1)) + assembly_time) / files_count
                         
         except Exception as e:
-            self.logger.debug(f"🔍 Stats update error: {e}")
+            self.logger.debug("🔍 Stats update error: %s", e)
     
-    async def _notify_progress(self, progress: AssemblyProgress) -> None:
-        """Notify progress callbacks with Apple-style updates"""
-        try:
-            for callback in self.progress_callbacks:
-                if callable(callback):
+    def _notify_progress(self, progress: AssemblyProgress) -> Awaitable[Any]:
+        """Notify progress callbacks with Apple-style updates
+        
+        Plain function returning an awaitable, so the common no-callback
+        case costs no coroutine allocation; async callbacks are gathered.
+        """
+        if not self.progress_callbacks:
+            return self._completed_future()
+        
+        pending = []
+        for callback in self.progress_callbacks:
+            if callable(callback):
+                is_async = self._callback_is_async.get(callback)
+                if is_async is None:
+                    is_async = self._classify_callback(callback)  # Appended directly to the list
+                if is_async:
+                    pending.append(self._run_progress_callback(callback, progress))
+                else:
                     try:
-                        if asyncio.iscoroutinefunction(callback):
-                            await callback(progress)
-                        else:
-                            callback(progress)
+                        callback(progress)
                     except Exception as e:
                         self.logger.warning(f"⚠️  Progress callback error: {e}")
-                        
+        
+        return asyncio.gather(*pending) if pending else self._completed_future()
+    
+    async def _run_progress_callback(self, callback: Callable, progress: AssemblyProgress) -> None:
+        """Await a single async progress callback"""
+        try:
+            await callback(progress)
         except Exception as e:
-            self.logger.warning(f"⚠️  Progress notification error: {e}")
+            self.logger.warning(f"⚠️  Progress callback error: {e}")
+    
+    def _completed_future(self) -> asyncio.Future:
+        """Already-resolved future shared by every no-op notification"""
+        future = self._done_future
+        if future is None:
+            future = self._done_future = asyncio.get_running_loop().create_future()
+            future.set_result(None)
+        return future
+    
+    def _classify_callback(self, callback: Callable) -> bool:
+        """Memoize whether a progress callback is a coroutine function"""
+        is_async = asyncio.iscoroutinefunction(callback)
+        self._callback_is_async[callback] = is_async
+        return is_async
     
     def register_progress_callback(self, callback: Callable[[AssemblyProgress], None]) -> None:
         """Register callback for progress updates"""
         self.progress_callbacks.append(callback)
+        if callable(callback):
+            self._classify_callback(callback)
     
     def get_supported_compression(self) -> List[str]:
         """Get list of supported compression algorithms"""
-        return [algo for algo, handler in self.compression_handlers.items() 
-                if handler.get("available", False)]
+        return list(self.compression_handlers)
     
     def get_supported_encryption(self) -> List[str]:
         """Get list of supported encryption algorithms"""
@@ -600,6 +1027,14 @@ class ChunkAssembler:
             }
         }
     
+    def shutdown(self) -> None:
+        """Stop the worker pools (the RS process pool would otherwise live until exit)"""
+        if self.rs_executor is not None:
+            self.rs_executor.shutdown(wait=False)
+            self.rs_executor = None
+        self.hash_executor.shutdown(wait=False)
+        self.decompress_executor.shutdown(wait=False)
+    
     def reset_stats(self) -> None:
         """Reset assembler statistics (air-gapped memory management)"""
         self.stats = {
@@ -66,6 +66,17 @@ class ParsedQRData:
     # Raw data for debugging
     raw_data: Optional[str] = None
     parsed_json: Optional[Dict[str, Any]] = None
+    
+    # Binary form of chunk_hash, decoded once at parse time
+    chunk_hash_bytes: Optional[bytes] = None
+    
+    def __post_init__(self):
+        """Decode the hex chunk hash so verification can compare raw bytes"""
+        if self.chunk_hash_bytes is None and isinstance(self.chunk_hash, str):
+            try:
+                self.chunk_hash_bytes = bytes.fromhex(self.chunk_hash)
+            except ValueError:
+                pass  # Odd-length or non-hex; verification falls back to text
 
 
 class QRDataParser:
@@ -210,6 +221,9 @@ class QRDataParser:
             if chunk_index >= total_chunks:
                 return self._create_error_result("Chunk index exceeds total", qr_data)
             
+            if total_chunks > self.config.max_chunks:
+                return self._create_error_result("Total chunks exceeds limit", qr_data)
+            
             # Decode chunk data
             try:
                 chunk_data = base64.b64decode(data["data_b64"])
@@ -269,6 +283,12 @@ class QRDataParser:
             if not isinstance(total_chunks, int) or total_chunks <= 0:
                 return self._create_error_result("Invalid total chunks", qr_data)
             
+            if chunk_index >= total_chunks:
+                return self._create_error_result("Chunk index exceeds total", qr_data)
+            
+            if total_chunks > self.config.max_chunks:
+                return self._create_error_result("Total chunks exceeds limit", qr_data)
+            
             # Decode chunk data
             try:
                 chunk_data = base64.b64decode(data["data_b64"])
@@ -313,6 +333,16 @@ class QRDataParser:
             chunk_index = int(parts[3])
             total_chunks = int(parts[5])
             
+            # Validate indices
+            if chunk_index < 0 or total_chunks <= 0:
+                return self._create_error_result("Invalid chunk index", qr_data)
+            
+            if chunk_index >= total_chunks:
+                return self._create_error_result("Chunk index exceeds total", qr_data)
+            
+            if total_chunks > self.config.max_chunks:
+                return self._create_error_result("Total chunks exceeds limit", qr_data)
+            
             # Reconstruct data part (may contain colons)
             data_part = ':'.join(parts[7:]) if len(parts) > 7 else parts[6] if len(parts) > 6 else ""
             
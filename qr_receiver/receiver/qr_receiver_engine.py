@@ -8,18 +8,54 @@ Designed with Apple's principles: reliability, security, and elegant simplicity.
 
 import asyncio
 import hashlib
+import heapq
+import hmac
 import json
+import os
+import tempfile
+import threading
 import time
 import weakref
+from collections import OrderedDict
 from enum import Enum
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Callable, Any, Union
+from typing import Dict, List, Optional, Set, Callable, Any, Tuple, Union
 from pathlib import Path
 import logging
 
 from ..core.config import QRReceiverConfig, SecurityLevel
 from .data_parser import QRDataParser, ParsedQRData
-from .chunk_assembler import ChunkAssembler, ChunkInfo
+from .chunk_assembler import ChunkAssembler, ChunkInfo, DATACLASS_SLOTS
+
+# Digest cache for re-scanned chunks (small chunks are cheaper to just hash)
+HASH_CACHE_SIZE = 4096
+HASH_CACHE_MIN_SIZE = 256
+
+# Chunks below this are hashed inline; larger ones go to the hash pool
+HASH_OFFLOAD_MIN_SIZE = 1024
+
+# Recently accepted raw frames, so camera re-scans can skip parsing
+FRAME_CACHE_SIZE = 1024
+
+# Per-chunk responses embed the full session summary every Nth chunk
+SUMMARY_INTERVAL = 32
+
+BYTE_UNITS = ("B", "KB", "MB", "GB", "TB")
+
+# Session IDs are plain identifiers: 64-bit xxh3 when available, else BLAKE2b
+try:
+    import xxhash
+
+    def _session_hash(key: bytes) -> str:
+        return xxhash.xxh3_64_hexdigest(key)
+except ImportError:
+    def _session_hash(key: bytes) -> str:
+        return hashlib.blake2b(key, digest_size=8).hexdigest()
+
+
+def _sha256_digest(data) -> bytes:
+    """SHA-256 of a buffer (runs on the hash pool)"""
+    return hashlib.sha256(data).digest()
 
 
 class ReceptionState(Enum):
@@ -32,7 +68,7 @@ class ReceptionState(Enum):
     FAILED = "failed"
 
 
-@dataclass
+@dataclass(**DATACLASS_SLOTS)
 class ReceptionSession:
     """
     Reception session for a file transfer
@@ -48,6 +84,9 @@ class ReceptionSession:
     
     # Reception tracking
     received_chunks: Dict[int, ChunkInfo] = field(default_factory=dict)
+    received_mask: int = 0  # Bit i set once chunk i has been stored
+    missing_count: int = -1  # Chunks still outstanding (set from total_chunks)
+    ordered_chunks: List[Optional[ChunkInfo]] = field(default_factory=list)  # Dense, index-ordered
     state: ReceptionState = ReceptionState.IDLE
     start_time: float = field(default_factory=time.time)
     last_activity: float = field(default_factory=time.time)
@@ -56,7 +95,9 @@ class ReceptionSession:
     compression_algorithm: Optional[str] = None
     encryption_enabled: bool = False
     reed_solomon_enabled: bool = False
+    reed_solomon_blocks: int = 0
     format_version: str = "qrfile/v2"
+    decryption_key: Optional[tuple] = None  # (salt, derived key) cached by the assembler
     
     # Progress tracking
     bytes_received: int = 0
@@ -68,32 +109,116 @@ class ReceptionSession:
     failed_chunks: Set[int] = field(default_factory=set)
     integrity_failures: int = 0
     
-    def update_progress(self) -> None:
+    # In-order SHA-256 of the chunk stream (only when it equals the final file)
+    _rolling_hash: Any = field(default=None, init=False, repr=False, compare=False)
+    _next_expected_chunk: int = field(default=0, init=False, repr=False, compare=False)
+    
+    # Status snapshot, dropped whenever any session attribute is reassigned
+    _summary_cache: Optional[Dict[str, Any]] = field(default=None, init=False, repr=False, compare=False)
+    
+    def __setattr__(self, name: str, value: Any) -> None:
+        object.__setattr__(self, name, value)
+        if name != "_summary_cache":
+            object.__setattr__(self, "_summary_cache", None)
+    
+    def __post_init__(self):
+        """Preallocate the dense chunk slots and the outstanding counter"""
+        if not self.ordered_chunks:
+            self.ordered_chunks = [None] * max(0, self.total_chunks or 0)
+        if self.missing_count < 0:
+            self.missing_count = max(0, self.total_chunks or 0)
+        
+        if self.expected_hash and self.passthrough:
+            self._rolling_hash = hashlib.sha256()
+    
+    @property
+    def passthrough(self) -> bool:
+        """Without compression, encryption or RS the chunks are the file itself"""
+        return (self.compression_algorithm in (None, "store")
+                and not self.encryption_enabled and not self.reed_solomon_enabled)
+    
+    def store_chunk(self, chunk_info: ChunkInfo) -> bool:
+        """Record a received chunk in the lookup dict, bitmask and dense slots"""
+        index = chunk_info.index
+        if not 0 <= index < self.total_chunks:
+            return False  # Out-of-range indexes would grow the bitmask unboundedly
+        bit = 1 << index
+        if not self.received_mask & bit:
+            self.missing_count -= 1
+        self.received_chunks[index] = chunk_info
+        self.received_mask |= bit
+        if index < len(self.ordered_chunks):
+            self.ordered_chunks[index] = chunk_info
+        
+        if self._rolling_hash is not None and index == self._next_expected_chunk:
+            self._advance_rolling_hash()
+        return True
+    
+    def _advance_rolling_hash(self) -> None:
+        """Feed the contiguous run of received chunks into the rolling hash"""
+        slots = self.ordered_chunks
+        position = self._next_expected_chunk
+        while position < len(slots) and slots[position] is not None:
+            if slots[position].data:
+                self._rolling_hash.update(slots[position].data)
+            position += 1
+        self._next_expected_chunk = position
+    
+    def rolling_digest(self) -> Optional[bytes]:
+        """SHA-256 of the whole chunk stream, once every chunk has been fed in"""
+        if self._rolling_hash is None or self._next_expected_chunk < self.total_chunks:
+            return None
+        return self._rolling_hash.digest()
+    
+    def update_progress(self, now: Optional[float] = None) -> None:
         """Update progress calculation with Apple-style smooth updates"""
+        if now is None:
+            now = time.time()
+        
         if self.total_chunks > 0:
-            self.progress_percentage = (len(self.received_chunks) / self.total_chunks) * 100
+            received = len(self.received_chunks)
+            self.progress_percentage = (received / self.total_chunks) * 100
             
             # Estimate completion time
-            if len(self.received_chunks) > 0:
-                elapsed = time.time() - self.start_time
-                rate = len(self.received_chunks) / elapsed
-                remaining = self.total_chunks - len(self.received_chunks)
+            if received > 0:
+                elapsed = now - self.start_time
+                rate = received / elapsed if elapsed > 0 else 0
+                remaining = self.total_chunks - received
                 self.estimated_completion = remaining / rate if rate > 0 else None
         
-        self.last_activity = time.time()
+        self.last_activity = now
     
     def is_complete(self) -> bool:
         """Check if all chunks have been received"""
-        return len(self.received_chunks) == self.total_chunks
+        return self.missing_count == 0
     
     def get_missing_chunks(self) -> List[int]:
-        """Get list of missing chunk indices"""
-        received_indices = set(self.received_chunks.keys())
-        all_indices = set(range(self.total_chunks))
-        return sorted(list(all_indices - received_indices))
+        """Get list of missing chunk indices (O(n); use missing_count for totals)"""
+        if not self.missing_count:
+            return []
+        
+        full_mask = (1 << max(0, self.total_chunks)) - 1
+        missing = full_mask & ~self.received_mask
+        if not missing:
+            return []
+        
+        # Scan the set bits of the inverted bitmap, lowest index first
+        bits = format(missing, "b")[::-1]
+        indices = []
+        index = bits.find("1")
+        while index != -1:
+            indices.append(index)
+            index = bits.find("1", index + 1)
+        return indices
     
     def get_status_summary(self) -> Dict[str, Any]:
         """Get comprehensive status for Apple-inspired UI"""
+        if self._summary_cache is None:
+            self._summary_cache = self._build_status_summary()
+        return dict(self._summary_cache)
+    
+    def _build_status_summary(self) -> Dict[str, Any]:
+        """Build the status snapshot returned by get_status_summary"""
         return {
             "session_id": self.session_id,
             "filename": self.filename,
@@ -102,7 +227,7 @@ class ReceptionSession:
                 "percentage": round(self.progress_percentage, 1),
                 "chunks_received": len(self.received_chunks),
                 "total_chunks": self.total_chunks,
-                "missing_chunks": len(self.get_missing_chunks())
+                "missing_chunks": self.missing_count
             },
             "timing": {
                 "start_time": self.start_time,
@@ -144,7 +269,8 @@ class QRReceiverEngine:
         # Session management
         self.active_sessions: Dict[str, ReceptionSession] = {}
         self.completed_sessions: Dict[str, ReceptionSession] = {}
-        self.session_callbacks: Dict[str, List[Callable]] = {}
+        self._completion_heap: List[Tuple[float, str]] = []  # (last_activity, session_id)
+        self.session_callbacks: Dict[str, Tuple[List[Callable], List[Callable]]] = {}  # (sync, async)
         
         # Statistics (air-gapped, memory-only)
         self.stats = {
@@ -157,6 +283,16 @@ class QRReceiverEngine:
             "error_rate": 0.0
         }
         
+        # SHA-256 digests of recently seen chunk payloads (LRU)
+        self._hash_cache: "OrderedDict[bytes, bytes]" = OrderedDict()
+        self._hash_cache_lock = threading.Lock()  # Digests are computed on pool threads
+        
+        # hashlib releases the GIL on large buffers; share the assembler's pool
+        self._hash_pool = self.chunk_assembler.hash_executor
+        
+        # Raw text of accepted frames -> (session_id, chunk_index) (FIFO)
+        self._frame_cache: "OrderedDict[str, tuple]" = OrderedDict()
+        
         # Security
         self.security_validator = None  # Will be imported on demand
         
@@ -189,23 +325,39 @@ class QRReceiverEngine:
             Processing result with status and session info
         """
         try:
+            # One clock read per scan, shared by every timestamp below
+            now = time.time()
+            
+            # Re-scanned frames of already stored chunks skip parsing entirely
+            seen = self._frame_cache.get(qr_data) if isinstance(qr_data, str) else None
+            if seen is not None:
+                session = self.active_sessions.get(seen[0])
+                if session is not None and seen[1] in session.received_chunks:
+                    result = self._create_success_response(session, "Duplicate chunk ignored")
+                    session.update_progress(now)
+                    await self._notify_session_callbacks(session.session_id, result)
+                    return result
+            
             # Parse QR data
             parsed_data = await self.data_parser.parse(qr_data)
             if not parsed_data.is_valid:
                 return self._create_error_response("Invalid QR data format", parsed_data.error)
             
             # Get or create session
-            session = await self._get_or_create_session(parsed_data)
+            session = await self._get_or_create_session(parsed_data, now)
             
             # Process chunk
-            result = await self._process_chunk(session, parsed_data)
+            result = await self._process_chunk(session, parsed_data, now)
+            if result.get("success") and parsed_data.chunk_index in session.received_chunks:
+                self._remember_frame(qr_data, session.session_id, parsed_data.chunk_index)
             
             # Update session state
-            session.update_progress()
+            session.update_progress(now)
             
             # Check if transfer is complete
             if session.is_complete():
                 await self._complete_session(session)
+                result["session"] = session.get_status_summary()
             
             # Notify callbacks
             await self._notify_session_callbacks(session.session_id, result)
@@ -216,66 +368,84 @@ class QRReceiverEngine:
             self.logger.error(f"❌ QR processing error: {e}")
             return self._create_error_response("Processing failed", str(e))
     
-    async def _get_or_create_session(self, parsed_data: ParsedQRData) -> ReceptionSession:
+    async def _get_or_create_session(self, parsed_data: ParsedQRData, now: Optional[float] = None) -> ReceptionSession:
         """Get existing session or create new one"""
         session_id = self._generate_session_id(parsed_data)
+        session = self.active_sessions.get(session_id)
         
-        if session_id not in self.active_sessions:
+        if session is None:
+            if now is None:
+                now = time.time()
+            
             # Create new session
             session = ReceptionSession(
                 session_id=session_id,
-                filename=parsed_data.filename or f"transfer_{int(time.time())}.tar.gz",
+                filename=parsed_data.filename or f"transfer_{int(now)}.tar.gz",
                 total_chunks=parsed_data.total_chunks,
                 expected_size=parsed_data.file_size or 0,
                 expected_hash=parsed_data.file_hash,
                 compression_algorithm=parsed_data.compression_algorithm,
                 encryption_enabled=parsed_data.encryption_enabled,
                 reed_solomon_enabled=parsed_data.reed_solomon_enabled,
-                format_version=parsed_data.format_version
+                reed_solomon_blocks=parsed_data.reed_solomon_blocks,
+                format_version=parsed_data.format_version,
+                start_time=now,
+                last_activity=now
             )
             
             session.state = ReceptionState.RECEIVING
             self.active_sessions[session_id] = session
             self.stats["total_sessions"] += 1
             
-            self.logger.info(f"🆕 New session: {session.filename} ({session.total_chunks} chunks)")
+            self.logger.info("🆕 New session: %s (%d chunks)", session.filename, session.total_chunks)
         
-        return self.active_sessions[session_id]
+        return session
     
-    async def _process_chunk(self, session: ReceptionSession, parsed_data: ParsedQRData) -> Dict[str, Any]:
+    async def _process_chunk(self, session: ReceptionSession, parsed_data: ParsedQRData,
+                             now: Optional[float] = None) -> Dict[str, Any]:
         """Process individual chunk with integrity verification"""
         try:
             chunk_index = parsed_data.chunk_index
             
+            if not 0 <= chunk_index < session.total_chunks:
+                session.error_count += 1
+                return self._create_error_response("Chunk index out of range")
+            
             # Check for duplicate
             if chunk_index in session.received_chunks:
                 return self._create_success_response(session, "Duplicate chunk ignored")
             
             # Verify chunk integrity if hash provided
-            if parsed_data.chunk_hash:
+            verified = False
+            if parsed_data.chunk_hash and parsed_data.chunk_data:
                 if not await self._verify_chunk_integrity(parsed_data):
                     session.integrity_failures += 1
                     session.failed_chunks.add(chunk_index)
                     return self._create_error_response("Chunk integrity verification failed")
+                verified = True
             
-            # Create chunk info
+            # Create chunk info (verified chunks are not re-hashed at assembly)
             chunk_info = ChunkInfo(
                 index=chunk_index,
                 data=parsed_data.chunk_data,
                 hash=parsed_data.chunk_hash,
                 size=len(parsed_data.chunk_data) if parsed_data.chunk_data else 0,
-                received_time=time.time()
+                received_time=now if now is not None else time.time(),
+                verified=verified
             )
             
             # Store chunk
-            session.received_chunks[chunk_index] = chunk_info
+            session.store_chunk(chunk_info)
             session.bytes_received += chunk_info.size
             self.stats["total_chunks_received"] += 1
             self.stats["total_bytes_received"] += chunk_info.size
             
-            self.logger.debug(f"📦 Chunk {chunk_index}/{session.total_chunks} received")
+            self.logger.debug("📦 Chunk %d/%d received", chunk_index, session.total_chunks)
             
-            return self._create_success_response(session, f"Chunk {chunk_index} received")
+            # Full summary on the first and last chunk, and periodically in between
+            received = len(session.received_chunks)
+            verbose = received == 1 or session.missing_count == 0 or received % SUMMARY_INTERVAL == 0
+            return self._create_success_response(session, f"Chunk {chunk_index} received", verbose)
             
         except Exception as e:
             session.error_count += 1
@@ -288,51 +458,110 @@ class QRReceiverEngine:
             if not parsed_data.chunk_data or not parsed_data.chunk_hash:
                 return True  # Skip verification if no hash provided
             
-            # Calculate actual hash
-            actual_hash = hashlib.sha256(parsed_data.chunk_data).hexdigest()
+            # Calculate actual hash (cached - cameras re-scan the same frames);
+            # larger chunks are hashed on the pool so concurrent scans overlap
+            data = parsed_data.chunk_data
+            if len(data) < HASH_OFFLOAD_MIN_SIZE:
+                actual_hash = self._chunk_digest(data)
+            else:
+                loop = asyncio.get_running_loop()
+                actual_hash = await loop.run_in_executor(self._hash_pool, self._chunk_digest, data)
             
-            # Compare with expected (may be truncated)
-            expected = parsed_data.chunk_hash
-            actual_short = actual_hash[:len(expected)]
+            # Constant-time compare against the expected (possibly truncated) digest
+            expected_bytes = parsed_data.chunk_hash_bytes
+            if expected_bytes is None:
+                expected = parsed_data.chunk_hash
+                return hmac.compare_digest(actual_hash.hex()[:len(expected)], expected)
             
-            return actual_short == expected
+            return hmac.compare_digest(actual_hash[:len(expected_bytes)], expected_bytes)
             
         except Exception as e:
             self.logger.error(f"❌ Integrity verification error: {e}")
             return False
     
+    def _remember_frame(self, qr_data: str, session_id: str, chunk_index: int) -> None:
+        """Record an accepted frame for the duplicate pre-filter"""
+        frames = self._frame_cache
+        if qr_data in frames:
+            return
+        frames[qr_data] = (session_id, chunk_index)
+        if len(frames) > FRAME_CACHE_SIZE:
+            frames.popitem(last=False)
+    
+    def _chunk_digest(self, data: bytes) -> bytes:
+        """SHA-256 digest of a chunk, memoized in a bounded LRU"""
+        if len(data) < HASH_CACHE_MIN_SIZE:
+            return hashlib.sha256(data).digest()
+        
+        key = hashlib.blake2b(data, digest_size=8).digest()
+        with self._hash_cache_lock:
+            digest = self._hash_cache.get(key)
+            if digest is not None:
+                self._hash_cache.move_to_end(key)
+                return digest
+        
+        digest = hashlib.sha256(data).digest()
+        with self._hash_cache_lock:
+            self._hash_cache[key] = digest
+            if len(self._hash_cache) > HASH_CACHE_SIZE:
+                self._hash_cache.popitem(last=False)
+        return digest
+    
     async def _complete_session(self, session: ReceptionSession) -> None:
         """Complete session and reconstruct file"""
         try:
             session.state = ReceptionState.ASSEMBLING
-            self.logger.info(f"🎉 All chunks received for {session.filename}")
+            self.logger.info("🎉 All chunks received for %s", session.filename)
+            
+            # Pass-through files are assembled straight into a temp file next to
+            # their destination; their hash was already computed on arrival
+            temp_path = None
+            if not self.config.memory_only and session.passthrough and session.bytes_received:
+                temp_path = self._create_temp_file(Path(self.config.download_directory), session.filename)
             
             # Assemble file
             session.state = ReceptionState.VERIFYING
-            file_data = await self.chunk_assembler.assemble_file(session)
-            
-            if file_data:
-                # Verify overall file integrity
-                if await self._verify_file_integrity(session, file_data):
-                    session.state = ReceptionState.COMPLETED
-                    self.stats["completed_sessions"] += 1
-                    
-                    # Save file (if not air-gapped memory-only mode)
-                    if not self.config.memory_only:
-                        await self._save_file(session, file_data)
-                    
-                    self.logger.info(f"✅ Transfer completed: {session.filename}")
+            file_data = None
+            try:
+                file_data = await self.chunk_assembler.assemble_file(session, temp_path)
+                
+                if file_data:
+                    # Verify overall file integrity
+                    if await self._verify_file_integrity(session, file_data):
+                        session.state = ReceptionState.COMPLETED
+                        self.stats["completed_sessions"] += 1
+                        
+                        # Save file (if not air-gapped memory-only mode)
+                        if temp_path is not None:
+                            file_data.close()
+                            file_path = self._publish_file(temp_path, Path(self.config.download_directory), session.filename)
+                            temp_path = None
+                            self.logger.info("💾 File saved: %s", file_path)
+                        elif not self.config.memory_only:
+                            await self._save_file(session, file_data)
+                        
+                        self.logger.info("✅ Transfer completed: %s", session.filename)
+                    else:
+                        session.state = ReceptionState.FAILED
+                        self.stats["failed_sessions"] += 1
+                        self.logger.error(f"❌ File integrity verification failed: {session.filename}")
                 else:
                     session.state = ReceptionState.FAILED
                     self.stats["failed_sessions"] += 1
-                    self.logger.error(f"❌ File integrity verification failed: {session.filename}")
-            else:
-                session.state = ReceptionState.FAILED
-                self.stats["failed_sessions"] += 1
-                self.logger.error(f"❌ File assembly failed: {session.filename}")
+                    self.logger.error(f"❌ File assembly failed: {session.filename}")
+            finally:
+                # Drop the temp file unless it was published
+                if temp_path is not None:
+                    if file_data is not None and hasattr(file_data, "close"):
+                        file_data.close()
+                    try:
+                        os.unlink(temp_path)
+                    except OSError:
+                        pass
             
             # Move to completed sessions
             self.completed_sessions[session.session_id] = session
+            heapq.heappush(self._completion_heap, (session.last_activity, session.session_id))
             del self.active_sessions[session.session_id]
             
         except Exception as e:
@@ -346,7 +575,12 @@ class QRReceiverEngine:
             if not session.expected_hash:
                 return True  # No hash to verify against
             
-            actual_hash = hashlib.sha256(file_data).hexdigest()
+            # Pass-through transfers were already hashed as the chunks arrived
+            digest = session.rolling_digest()
+            if digest is None:
+                loop = asyncio.get_running_loop()
+                digest = await loop.run_in_executor(self._hash_pool, _sha256_digest, file_data)
+            actual_hash = digest.hex()
             expected = session.expected_hash
             
             # Handle truncated hashes
@@ -366,45 +600,84 @@ class QRReceiverEngine:
             if self.config.memory_only:
                 return  # Skip saving in memory-only mode
             
-            # Create download directory
-            download_dir = Path(self.config.download_directory)
-            download_dir.mkdir(parents=True, exist_ok=True)
-            
-            # Generate unique filename if needed
-            file_path = download_dir / session.filename
-            counter = 1
-            while file_path.exists():
-                name, ext = session.filename.rsplit('.', 1) if '.' in session.filename else (session.filename, '')
-                new_name = f"{name}_{counter}.{ext}" if ext else f"{name}_{counter}"
-                file_path = download_dir / new_name
-                counter += 1
-            
-            # Save file
-            with open(file_path, 'wb') as f:
-                f.write(file_data)
+            # Write off the event loop so large files don't stall reception
+            loop = asyncio.get_running_loop()
+            file_path = await loop.run_in_executor(
+                None, self._write_file, Path(self.config.download_directory), session.filename, file_data
+            )
             
-            self.logger.info(f"💾 File saved: {file_path}")
+            self.logger.info("💾 File saved: %s", file_path)
             
         except Exception as e:
             self.logger.error(f"❌ File save error: {e}")
     
+    @staticmethod
+    def _open_unique(download_dir: Path, filename: str) -> Tuple[Path, Any]:
+        """Exclusively create a unique path in download_dir, returning it open for writing"""
+        # Create download directory
+        download_dir.mkdir(parents=True, exist_ok=True)
+        
+        # Generate unique filename if needed
+        file_path = download_dir / filename
+        counter = 1
+        while True:
+            try:
+                return file_path, open(file_path, 'xb', buffering=0)
+            except FileExistsError:
+                name, ext = filename.rsplit('.', 1) if '.' in filename else (filename, '')
+                new_name = f"{name}_{counter}.{ext}" if ext else f"{name}_{counter}"
+                file_path = download_dir / new_name
+                counter += 1
+    
+    @classmethod
+    def _write_file(cls, download_dir: Path, filename: str, file_data: bytes) -> Path:
+        """Write file data to a unique path in download_dir (blocking)"""
+        file_path, f = cls._open_unique(download_dir, filename)
+        
+        # Unbuffered writes straight from the assembled buffer
+        with f:
+            view = memoryview(file_data)
+            while view:
+                view = view[f.write(view):]
+        
+        return file_path
+    
+    @staticmethod
+    def _create_temp_file(download_dir: Path, filename: str) -> Path:
+        """Create a hidden temp file in download_dir to assemble into"""
+        download_dir.mkdir(parents=True, exist_ok=True)
+        fd, temp_name = tempfile.mkstemp(prefix=f".{Path(filename).name}.", suffix=".part", dir=download_dir)
+        os.close(fd)
+        os.chmod(temp_name, 0o644)  # mkstemp creates 0600; match regular saves
+        return Path(temp_name)
+    
+    @classmethod
+    def _publish_file(cls, temp_path: Path, download_dir: Path, filename: str) -> Path:
+        """Atomically move a finished temp file onto a unique path in download_dir"""
+        file_path, f = cls._open_unique(download_dir, filename)
+        f.close()
+        os.replace(temp_path, file_path)
+        return file_path
+    
     def _generate_session_id(self, parsed_data: ParsedQRData) -> str:
         """Generate session ID from file metadata"""
-        components = [
-            parsed_data.filename or "unknown",
-            str(parsed_data.total_chunks),
-            str(parsed_data.file_size or 0)
-        ]
-        session_key = "_".join(components)
-        return hashlib.md5(session_key.encode()).hexdigest()[:16]
-    
-    def _create_success_response(self, session: ReceptionSession, message: str) -> Dict[str, Any]:
-        """Create successful response with session status"""
-        return {
+        session_key = f"{parsed_data.filename or 'unknown'}|{parsed_data.total_chunks}|{parsed_data.file_size or 0}"
+        return _session_hash(session_key.encode())
+    
+    def _create_success_response(self, session: ReceptionSession, message: str,
+                                 verbose: bool = False) -> Dict[str, Any]:
+        """Create successful response with compact progress (full status if verbose)"""
+        received = len(session.received_chunks)
+        response = {
             "success": True,
             "message": message,
-            "session": session.get_status_summary()
+            "session_id": session.session_id,
+            "progress": round(session.progress_percentage, 1),
+            "chunks": (received, session.total_chunks)
         }
+        if verbose:
+            response["session"] = session.get_status_summary()
+        return response
     
     def _create_error_response(self, message: str, details: Optional[str] = None) -> Dict[str, Any]:
         """Create error response"""
@@ -419,24 +692,39 @@ class QRReceiverEngine:
     async def _notify_session_callbacks(self, session_id: str, result: Dict[str, Any]) -> None:
         """Notify registered callbacks about session updates"""
         try:
-            if session_id in self.session_callbacks:
-                for callback in self.session_callbacks[session_id]:
-                    if callable(callback):
-                        try:
-                            if asyncio.iscoroutinefunction(callback):
-                                await callback(session_id, result)
-                            else:
-                                callback(session_id, result)
-                        except Exception as e:
-                            self.logger.error(f"❌ Callback error: {e}")
+            callbacks = self.session_callbacks.get(session_id)
+            if callbacks is None:
+                return
+            
+            sync_callbacks, async_callbacks = callbacks
+            for callback in sync_callbacks:
+                try:
+                    callback(session_id, result)
+                except Exception as e:
+                    self.logger.error(f"❌ Callback error: {e}")
+            
+            # Async callbacks run concurrently in a single scheduler pass
+            if async_callbacks:
+                outcomes = await asyncio.gather(
+                    *(callback(session_id, result) for callback in async_callbacks),
+                    return_exceptions=True
+                )
+                for outcome in outcomes:
+                    if isinstance(outcome, Exception):
+                        self.logger.error(f"❌ Callback error: {outcome}")
         except Exception as e:
             self.logger.error(f"❌ Callback notification error: {e}")
     
     def register_session_callback(self, session_id: str, callback: Callable) -> None:
         """Register callback for session updates"""
-        if session_id not in self.session_callbacks:
-            self.session_callbacks[session_id] = []
-        self.session_callbacks[session_id].append(callback)
+        if not callable(callback):
+            return
+        
+        sync_callbacks, async_callbacks = self.session_callbacks.setdefault(session_id, ([], []))
+        if asyncio.iscoroutinefunction(callback):
+            async_callbacks.append(callback)
+        else:
+            sync_callbacks.append(callback)
     
     def get_session_status(self, session_id: str) -> Optional[Dict[str, Any]]:
         """Get status of specific session"""
@@ -460,20 +748,20 @@ class QRReceiverEngine:
             cutoff_time = time.time() - (max_age_hours * 3600)
             cleaned = 0
             
-            # Clean completed sessions
-            to_remove = []
-            for session_id, session in self.completed_sessions.items():
-                if session.last_activity < cutoff_time:
-                    to_remove.append(session_id)
-            
-            for session_id in to_remove:
+            # Clean completed sessions, oldest first
+            heap = self._completion_heap
+            while heap and heap[0][0] < cutoff_time:
+                completed_at, session_id = heapq.heappop(heap)
+                session = self.completed_sessions.get(session_id)
+                if session is None or session.last_activity > completed_at:
+                    continue  # Already removed, or replaced by a newer transfer
+                
                 del self.completed_sessions[session_id]
-                if session_id in self.session_callbacks:
-                    del self.session_callbacks[session_id]
+                self.session_callbacks.pop(session_id, None)
                 cleaned += 1
             
             if cleaned > 0:
-                self.logger.info(f"🧹 Cleaned {cleaned} old sessions")
+                self.logger.info("🧹 Cleaned %d old sessions", cleaned)
             
             return cleaned
             
@@ -481,6 +769,10 @@ class QRReceiverEngine:
             self.logger.error(f"❌ Session cleanup error: {e}")
             return 0
     
+    def shutdown(self) -> None:
+        """Release the assembler's worker pools"""
+        self.chunk_assembler.shutdown()
+    
     def get_apple_inspired_stats(self) -> Dict[str, Any]:
         """Get beautifully formatted statistics for Apple-inspired UI"""
         return {
@@ -505,8 +797,9 @@ class QRReceiverEngine:
     
     def _format_bytes(self, bytes_count: int) -> str:
         """Format bytes in human-readable format (Apple style)"""
-        for unit in ['B', 'KB', 'MB', 'GB']:
-            if bytes_count < 1024:
-                return f"{bytes_count:.1f} {unit}"
-            bytes_count /= 1024
-        return f"{bytes_count:.1f} TB"
\ No newline at end of file
+        if bytes_count < 1024:
+            return f"{bytes_count:.1f} B"
+        
+        # Unit index straight from the bit length (1024 = 2**10 per step)
+        exponent = min((int(bytes_count).bit_length() - 1) // 10, len(BYTE_UNITS) - 1)
+        return f"{bytes_count / (1 << (10 * exponent)):.1f} {BYTE_UNITS[exponent]}"
\ No newline at end of file
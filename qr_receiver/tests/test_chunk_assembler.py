@@ -0,0 +1,44 @@
+"""
+Chunk Assembler Tests
+=====================
+
+Run from the repository root with: python -m pytest qr_receiver/tests
+"""
+
+import asyncio
+import sys
+from pathlib import Path
+from types import SimpleNamespace
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from qr_receiver.core.config import QRReceiverConfig
+from qr_receiver.receiver.chunk_assembler import AssemblyProgress, ChunkAssembler
+
+
+def _decompress(assembler, algorithm, data, expected_size):
+    session = SimpleNamespace(compression_algorithm=algorithm, expected_size=expected_size)
+    return asyncio.run(assembler._decompress_data(data, session, AssemblyProgress()))
+
+
+def test_zstandard_round_trip():
+    zstd = pytest.importorskip("zstandard")
+    assembler = ChunkAssembler(QRReceiverConfig())
+    payload = b"zstandard round trip " * 50000
+    compressed = zstd.ZstdCompressor().compress(payload)
+    
+    # One buffer, and the pipelined chunk-list form
+    assert bytes(_decompress(assembler, "zstandard", compressed, len(payload))) == payload
+    chunks = [compressed[i:i + 700] for i in range(0, len(compressed), 700)]
+    assert bytes(_decompress(assembler, "zstandard", chunks, len(payload))) == payload
+
+
+def test_zstandard_respects_size_limit():
+    zstd = pytest.importorskip("zstandard")
+    assembler = ChunkAssembler(QRReceiverConfig(max_decompressed_size=1 << 20))
+    # Streamed without a content size in the header, so only the running check can catch it
+    compressed = zstd.ZstdCompressor(write_content_size=False).compress(bytes(8 << 20))
+    
+    assert _decompress(assembler, "zstandard", compressed, 0) is None
@@ -0,0 +1,58 @@
+"""
+QR Receiver Engine Tests
+========================
+
+Run from the repository root with: python -m pytest qr_receiver/tests
+"""
+
+import asyncio
+import base64
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parents[2]))
+
+from qr_receiver.core.config import QRReceiverConfig
+from qr_receiver.receiver.chunk_assembler import ChunkInfo
+from qr_receiver.receiver.qr_receiver_engine import QRReceiverEngine, ReceptionSession
+
+
+def _v1_frame(index, total):
+    return json.dumps({
+        "fmt": "qrfile/v1", "name": "range.bin", "index": index, "total": total,
+        "data_b64": base64.b64encode(b"chunk").decode(),
+    })
+
+
+def test_out_of_range_chunk_index_is_rejected():
+    engine = QRReceiverEngine(QRReceiverConfig())
+
+    async def scan():
+        assert (await engine.process_qr_data(_v1_frame(0, 4)))["success"]
+        frames = [
+            _v1_frame(400_000_000, 4),
+            _v1_frame(0, 10 ** 9),
+            "F:range.bin:I:400000000:T:4:D:" + base64.b64encode(b"chunk").decode(),
+        ]
+        return [await engine.process_qr_data(frame) for frame in frames]
+
+    try:
+        results = asyncio.run(scan())
+    finally:
+        engine.shutdown()
+
+    assert not any(result["success"] for result in results)
+    session, = engine.active_sessions.values()
+    assert list(session.received_chunks) == [0]
+    assert session.received_mask == 1
+    assert session.missing_count == 3
+
+
+def test_store_chunk_ignores_out_of_range_index():
+    session = ReceptionSession(session_id="s", filename="f", total_chunks=2, expected_size=0)
+    
+    assert not session.store_chunk(ChunkInfo(index=400_000_000, data=b"x", size=1))
+    assert session.received_mask == 0
+    assert not session.received_chunks
+    assert session.missing_count == 2
@@ -146,6 +146,8 @@ class AppleInspiredWebServer:
             if self.runner:
                 await self.runner.cleanup()
             
+            self.receiver_engine.shutdown()
+            
             self.logger.info("✅ Web server stopped successfully")
             
         except Exception as e:
@@ -9,14 +9,20 @@ Implements secure memory clearing and process hardening.
 import os
 import gc
 import sys
+import itertools
 import ctypes
-import random
+import ctypes.util
 import platform
 import threading
+import time
 import weakref
+from collections import deque
 from typing import Optional, List, Any, Callable
 import logging
 
+# The platform can't change at runtime; resolve it once
+_CURRENT_PLATFORM = platform.system()
+
 # Platform-specific imports
 try:
     import mlock
@@ -25,13 +31,136 @@ except ImportError:
     MLOCK_AVAILABLE = False
 
 try:
-    if platform.system() == "Windows":
+    if _CURRENT_PLATFORM == "Windows":
         import ctypes.wintypes
         from ctypes import wintypes
-    WINDOWS_API_AVAILABLE = platform.system() == "Windows"
+    WINDOWS_API_AVAILABLE = _CURRENT_PLATFORM == "Windows"
 except ImportError:
     WINDOWS_API_AVAILABLE = False
 
+try:
+    import mmap
+    MMAP_AVAILABLE = True
+except ImportError:
+    MMAP_AVAILABLE = False
+
+# psutil is optional; it only backs the memory statistics
+try:
+    import psutil
+    PSUTIL_AVAILABLE = True
+except ImportError:
+    PSUTIL_AVAILABLE = False
+
+# kernel32 handle, looked up once (windll resolves on every attribute access)
+_KERNEL32 = ctypes.windll.kernel32 if WINDOWS_API_AVAILABLE else None
+
+# SetProcessMitigationPolicy (PROCESS_MITIGATION_POLICY, flags). Each policy
+# struct is a single DWORD of flag bits. ASLR bottom-up/high-entropy can only be
+# set at image load time, and dynamic-code prohibition would break ctypes
+# callbacks, so neither is requested here.
+_WINDOWS_MITIGATION_POLICIES = (
+    (1, 0x2),  # ProcessASLRPolicy: EnableForceRelocateImages
+    (3, 0x3),  # ProcessStrictHandleCheckPolicy: RaiseExceptionOnInvalidHandleReference | HandleExceptionsPermanentlyEnabled
+    (6, 0x1),  # ProcessExtensionPointDisablePolicy: DisableExtensionPoints
+)
+
+
+def _load_libc() -> Optional[ctypes.CDLL]:
+    """Load the C library (None on Windows or if it can't be found)"""
+    if _CURRENT_PLATFORM == "Windows":
+        return None
+    # The running process already has libc mapped: dlopen(NULL) exposes its
+    # symbols without find_library, which spawns ldconfig/gcc on Linux
+    for name in (None, "libc.so.6"):
+        try:
+            libc = ctypes.CDLL(name)
+            if hasattr(libc, "memset"):
+                return libc
+        except OSError:
+            pass
+    try:
+        return ctypes.CDLL(ctypes.util.find_library("c"))
+    except OSError:
+        return None
+
+
+_LIBC = _load_libc()
+
+
+def _resolve_secure_memzero() -> Callable[[int, int], Any]:
+    """Pick the platform's zeroing primitive once at import"""
+    if _CURRENT_PLATFORM != "Windows":
+        libc = _LIBC
+        if libc is not None:
+            # explicit_bzero (glibc 2.25+, BSDs) is guaranteed not to be elided
+            if hasattr(libc, "explicit_bzero"):
+                explicit_bzero = libc.explicit_bzero
+                explicit_bzero.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+                explicit_bzero.restype = None
+                return explicit_bzero
+            
+            # memset_s (macOS, C11 Annex K) carries the same guarantee
+            if hasattr(libc, "memset_s"):
+                memset_s = libc.memset_s
+                memset_s.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_int, ctypes.c_size_t]
+                memset_s.restype = ctypes.c_int
+                return lambda address, size: memset_s(address, size, 0, size)
+    
+    # A memset across the FFI boundary can't be optimised away either
+    return lambda address, size: ctypes.memset(address, 0, size)
+
+
+_secure_memzero = _resolve_secure_memzero()
+
+
+def _resolve_heap_trim() -> Optional[Callable[[], Any]]:
+    """Pick the allocator call that hands freed heap pages back to the OS"""
+    try:
+        if _KERNEL32 is not None:
+            return lambda: _KERNEL32.HeapCompact(_KERNEL32.GetProcessHeap(), 0)
+        
+        if _LIBC is not None and hasattr(_LIBC, "malloc_trim"):  # glibc
+            malloc_trim = _LIBC.malloc_trim
+            malloc_trim.argtypes = [ctypes.c_size_t]
+            malloc_trim.restype = ctypes.c_int
+            return lambda: malloc_trim(0)
+        
+        if _LIBC is not None and hasattr(_LIBC, "malloc_zone_pressure_relief"):  # macOS
+            pressure_relief = _LIBC.malloc_zone_pressure_relief
+            pressure_relief.argtypes = [ctypes.c_void_p, ctypes.c_size_t]
+            pressure_relief.restype = ctypes.c_size_t
+            return lambda: pressure_relief(None, 0)
+    except (AttributeError, OSError):
+        pass
+    return None
+
+
+_heap_trim = _resolve_heap_trim()
+
+
+def _resolve_getrandom() -> Optional[Callable[[int, int, int], int]]:
+    """libc getrandom (Linux 3.17+/glibc 2.25+), which fills a buffer in place"""
+    if _LIBC is None or not hasattr(_LIBC, "getrandom"):
+        return None
+    getrandom = _LIBC.getrandom
+    getrandom.argtypes = [ctypes.c_void_p, ctypes.c_size_t, ctypes.c_uint]
+    getrandom.restype = ctypes.c_ssize_t
+    return getrandom
+
+
+_getrandom = _resolve_getrandom()
+
+# Python 3.13+ f_locals is a write-through proxy (PEP 667) and the C API is gone
+_LOCALS_TO_FAST = (
+    getattr(getattr(ctypes, "pythonapi", None), "PyFrame_LocalsToFast", None)
+    if sys.version_info < (3, 13) else None
+)
+
+# Containers that can be scrubbed in place and may hold further secrets.
+# Exact-type set lookup: ints/None/str/bytes can't be scrubbed, so numeric-heavy
+# containers are skipped with one hash probe per item instead of isinstance().
+_MUTABLE_TYPES = frozenset({bytearray, list, dict})
+
 
 class SecureMemoryManager:
     """
@@ -44,24 +173,35 @@ class SecureMemoryManager:
     def __init__(self):
         """Initialize secure memory manager"""
         self.logger = logging.getLogger("SecureMemoryManager")
-        self.registered_objects = []
-        self.cleanup_callbacks = []
+        self.registered_objects = weakref.WeakValueDictionary()  # id(obj) -> obj, dead entries drop out
+        self.cleanup_finalizers = {}  # key -> weakref.finalize, removed when it fires
+        self._finalizer_keys = itertools.count()
         self.is_initialized = False
-        self.lock = threading.RLock()
+        self.lock = threading.Lock()  # Guards registered_objects / cleanup_finalizers only
+        
+        # Zeroing handlers keyed by exact built-in type
+        self._zero_dispatch = {
+            bytearray: self._secure_zero_bytes,
+            bytes: self._secure_zero_bytes,
+            str: self._secure_zero_string,
+            list: self._secure_zero_list,
+            dict: self._secure_zero_dict
+        }
+        
+        # Process handle for memory stats, created once (psutil is optional)
+        self._process = psutil.Process() if PSUTIL_AVAILABLE else None
+        self._virtual_memory = (0.0, None)  # (monotonic timestamp, sample)
         
         # Platform-specific initialization
-        self.platform = platform.system()
+        self.platform = _CURRENT_PLATFORM
         self._initialize_platform_specific()
     
     def _initialize_platform_specific(self) -> None:
         """Initialize platform-specific memory security"""
         try:
-            if self.platform == "Windows":
-                self._initialize_windows_security()
-            elif self.platform == "Darwin":  # macOS
-                self._initialize_macos_security()
-            elif self.platform == "Linux":
-                self._initialize_linux_security()
+            initializer = _PLATFORM_INITIALIZERS.get(self.platform)
+            if initializer is not None:
+                initializer(self)
             
             self.is_initialized = True
             self.logger.info(f"🔒 Secure memory manager initialized for {self.platform}")
@@ -78,7 +218,7 @@ class SecureMemoryManager:
             
             # Set process memory protection
             try:
-                kernel32 = ctypes.windll.kernel32
+                kernel32 = _KERNEL32
                 process_handle = kernel32.GetCurrentProcess()
                 
                 # Set process mitigation policy (if available)
@@ -88,6 +228,14 @@ class SecureMemoryManager:
                 except:
                     pass  # May not be available on all Windows versions
                 
+                # Modern mitigations (Windows 8+)
+                set_policy = getattr(kernel32, 'SetProcessMitigationPolicy', None)
+                if set_policy is not None:
+                    for policy, flags in _WINDOWS_MITIGATION_POLICIES:
+                        value = ctypes.c_uint32(flags)
+                        if not set_policy(policy, ctypes.byref(value), ctypes.sizeof(value)):
+                            self.logger.debug(f"Mitigation policy {policy} not applied: {ctypes.GetLastError()}")
+                
                 self.logger.debug("✅ Windows memory protection enabled")
                 
             except Exception as e:
@@ -116,13 +264,9 @@ class SecureMemoryManager:
                 self.logger.debug("✅ Linux memory locking available")
             
             # Check for additional security features
-            try:
-                # Check if we can use madvise for secure operations
-                import mmap
-                if hasattr(mmap, 'MADV_DONTDUMP'):
-                    self.logger.debug("✅ Linux MADV_DONTDUMP available")
-            except:
-                pass
+            # Check if we can use madvise for secure operations
+            if MMAP_AVAILABLE and hasattr(mmap, 'MADV_DONTDUMP'):
+                self.logger.debug("✅ Linux MADV_DONTDUMP available")
             
         except Exception as e:
             self.logger.warning(f"Linux memory security initialization failed: {e}")
@@ -138,30 +282,45 @@ class SecureMemoryManager:
             True if memory was successfully cleared
         """
         try:
-            with self.lock:
-                if isinstance(data, (bytes, bytearray)):
-                    return self._secure_zero_bytes(data)
-                elif isinstance(data, str):
-                    return self._secure_zero_string(data)
-                elif isinstance(data, list):
-                    return self._secure_zero_list(data)
-                elif isinstance(data, dict):
-                    return self._secure_zero_dict(data)
-                else:
-                    # For other types, try to clear referenced objects
-                    return self._secure_zero_object(data)
+            handler = self._zero_dispatch.get(type(data))
+            if handler is None:
+                handler = self._zero_handler_for_subclass(data)
+            return handler(data)
                     
         except Exception as e:
             self.logger.error(f"❌ Secure memory zeroing failed: {e}")
             return False
     
+    def _zero_handler_for_subclass(self, data: Any) -> Callable[[Any], bool]:
+        """Resolve the zeroing handler for types not in the exact-type table"""
+        if isinstance(data, (bytes, bytearray)):
+            return self._secure_zero_bytes
+        elif isinstance(data, str):
+            return self._secure_zero_string
+        elif isinstance(data, list):
+            return self._secure_zero_list
+        elif isinstance(data, dict):
+            return self._secure_zero_dict
+        else:
+            # For other types, try to clear referenced objects
+            return self._secure_zero_object
+    
     def _secure_zero_bytes(self, data: bytes) -> bool:
         """Securely zero bytes/bytearray data"""
         try:
             if isinstance(data, bytearray):
-                # Direct modification for bytearray
-                for i in range(len(data)):
-                    data[i] = 0
+                # Zero the buffer in place with a single native call
+                size = len(data)
+                if size:
+                    try:
+                        buf = (ctypes.c_char * size).from_buffer(data)
+                        _secure_memzero(ctypes.addressof(buf), size)
+                        del buf  # Release the export so the bytearray can resize again
+                    except (TypeError, ValueError, AttributeError, OSError):
+                        # No usable ctypes buffer (e.g. PyPy) - still a single C-level copy
+                        view = memoryview(data)
+                        view[:] = bytes(size)
+                        view.release()
                 return True
             else:
                 # For bytes, we can't modify in place
@@ -188,14 +347,7 @@ class SecureMemoryManager:
     def _secure_zero_list(self, data: list) -> bool:
         """Securely zero list data"""
         try:
-            # Clear all elements
-            for i in range(len(data)):
-                if isinstance(data[i], (bytes, bytearray, str, list, dict)):
-                    self.secure_zero_memory(data[i])
-                data[i] = None
-            
-            # Clear the list
-            data.clear()
+            self._zero_tree(data)
             return True
             
         except Exception as e:
@@ -205,30 +357,53 @@ class SecureMemoryManager:
     def _secure_zero_dict(self, data: dict) -> bool:
         """Securely zero dictionary data"""
         try:
-            # Clear all values
-            for key, value in list(data.items()):
-                if isinstance(value, (bytes, bytearray, str, list, dict)):
-                    self.secure_zero_memory(value)
-                if isinstance(key, (bytes, bytearray, str, list, dict)):
-                    self.secure_zero_memory(key)
-            
-            # Clear the dictionary
-            data.clear()
+            self._zero_tree(data)
             return True
             
         except Exception as e:
             self.logger.debug(f"Dict zeroing error: {e}")
             return False
     
+    def _zero_tree(self, root: Any) -> None:
+        """Zero nested lists/dicts/bytearrays with an explicit worklist
+        
+        Iterative so deeply nested data can't hit the recursion limit, and
+        leaves are zeroed directly without going back through dispatch.
+        Containers are cleared as they are visited, so cycles terminate.
+        """
+        stack = deque([root])
+        while stack:
+            obj = stack.pop()
+            if isinstance(obj, bytearray):
+                self._secure_zero_bytes(obj)
+            elif isinstance(obj, list):
+                stack.extend(item for item in obj if type(item) in _MUTABLE_TYPES)
+                obj.clear()
+            elif isinstance(obj, dict):
+                # Keys are hashable, hence immutable - only values can be scrubbed
+                stack.extend(value for value in obj.values() if type(value) in _MUTABLE_TYPES)
+                obj.clear()
+    
     def _secure_zero_object(self, obj: Any) -> bool:
         """Securely zero arbitrary object"""
         try:
-            # Try to clear object attributes
-            if hasattr(obj, '__dict__'):
-                for attr_name, attr_value in list(obj.__dict__.items()):
-                    if isinstance(attr_value, (bytes, bytearray, str, list, dict)):
-                        self.secure_zero_memory(attr_value)
-                    setattr(obj, attr_name, None)
+            # Scrub mutable attribute values, then drop all attributes at once
+            attrs = getattr(obj, '__dict__', None)
+            if isinstance(attrs, dict):
+                self._zero_tree([value for value in attrs.values() if type(value) in _MUTABLE_TYPES])
+                attrs.clear()
+            
+            # __slots__ attributes live outside __dict__
+            for cls in type(obj).__mro__:
+                slots = cls.__dict__.get('__slots__', ())
+                for slot in (slots,) if isinstance(slots, str) else slots:
+                    if slot in ('__dict__', '__weakref__'):
+                        continue
+                    value = getattr(obj, slot, None)
+                    if type(value) in _MUTABLE_TYPES:
+                        self._zero_tree(value)
+                    if value is not None:
+                        setattr(obj, slot, None)
             
             return True
             
@@ -240,77 +415,129 @@ class SecureMemoryManager:
         """Register object for automatic cleanup on shutdown"""
         try:
             with self.lock:
-                # Use weak reference to avoid keeping objects alive
-                weak_ref = weakref.ref(obj)
-                self.registered_objects.append(weak_ref)
+                # Weak values avoid keeping objects alive
+                self.registered_objects[id(obj)] = obj
                 
                 if callback:
-                    self.cleanup_callbacks.append(callback)
+                    # Runs once: when obj is collected, at exit, or on emergency cleanup
+                    key = next(self._finalizer_keys)
+                    self.cleanup_finalizers[key] = weakref.finalize(
+                        obj, self._run_cleanup_callback, key, callback
+                    )
                     
         except Exception as e:
             self.logger.warning(f"⚠️  Cleanup registration failed: {e}")
     
+    def _run_cleanup_callback(self, key: int, callback: Callable) -> None:
+        """Finalizer body: forget the registration, then run the callback"""
+        # dict.pop is atomic, so this is safe from a GC pass while the lock is held
+        self.cleanup_finalizers.pop(key, None)
+        try:
+            callback()
+        except Exception as e:
+            self.logger.debug(f"Cleanup callback error: {e}")
+    
     def emergency_cleanup(self) -> None:
         """Perform emergency memory cleanup"""
         try:
             self.logger.info("🧹 Emergency memory cleanup initiated")
             
+            # Detach the registrations under the lock; zeroing and callbacks
+            # run outside it so callbacks may register new data
             with self.lock:
-                # Clear registered objects
-                cleanup_count = 0
-                for weak_ref in self.registered_objects.copy():
-                    try:
-                        obj = weak_ref()
-                        if obj is not None:
-                            self.secure_zero_memory(obj)
-                            cleanup_count += 1
-                    except:
-                        pass
-                
-                # Execute cleanup callbacks
-                for callback in self.cleanup_callbacks.copy():
-                    try:
-                        callback()
-                    except Exception as e:
-                        self.logger.debug(f"Cleanup callback error: {e}")
-                
-                # Clear collections
+                objects = list(self.registered_objects.values())
                 self.registered_objects.clear()
-                self.cleanup_callbacks.clear()
-                
-                # Force garbage collection multiple times
-                for _ in range(3):
-                    gc.collect()
-                
-                self.logger.info(f"🧹 Emergency cleanup completed: {cleanup_count} objects cleared")
+                finalizers = self.cleanup_finalizers
+                self.cleanup_finalizers = {}
+            
+            # Clear registered objects
+            cleanup_count = 0
+            for obj in objects:
+                try:
+                    self.secure_zero_memory(obj)
+                    cleanup_count += 1
+                except:
+                    pass
+            del objects
+            
+            # Fire pending finalizers now; ones that already ran are no-ops
+            for finalizer in finalizers.values():
+                finalizer()
+            del finalizers
+            
+            # One full collection (finalizers and cycles are handled in a single pass)
+            rss_before = self._process.memory_info().rss if self._process is not None else None
+            gc.collect(2)
+            
+            # Return freed pages to the OS so cleared data doesn't linger in the heap
+            if _heap_trim is not None:
+                try:
+                    _heap_trim()
+                except Exception as e:
+                    self.logger.debug(f"Heap trim error: {e}")
+            
+            if rss_before is not None:
+                self.logger.debug(f"🧹 RSS after cleanup: {rss_before} -> {self._process.memory_info().rss} bytes")
+            
+            self.logger.info(f"🧹 Emergency cleanup completed: {cleanup_count} objects cleared")
                 
         except Exception as e:
             self.logger.error(f"❌ Emergency cleanup failed: {e}")
     
     def secure_random_fill(self, size: int) -> bytearray:
         """Generate secure random data for overwriting"""
-        try:
-            return bytearray(random.getrandbits(8) for _ in range(size))
-        except Exception:
-            # Fallback to os.urandom
-            return bytearray(os.urandom(size))
+        return bytearray(os.urandom(size))
+    
+    def secure_random_bytes(self, size: int) -> bytes:
+        """Generate secure random data for read-only use (no bytearray copy)"""
+        return os.urandom(size)
+    
+    def secure_random_fill_into(self, buf: bytearray) -> None:
+        """Overwrite an existing buffer in place with secure random data"""
+        size = len(buf)
+        if _getrandom is not None and size:
+            # Kernel writes straight into the buffer; no intermediate bytes object
+            view = (ctypes.c_char * size).from_buffer(buf)
+            try:
+                address = ctypes.addressof(view)
+                filled = 0
+                while filled < size:
+                    count = _getrandom(address + filled, size - filled, 0)
+                    if count < 0:
+                        break  # EINTR and friends - fall back below
+                    filled += count
+                if filled == size:
+                    return
+            finally:
+                del view
+        memoryview(buf)[:] = os.urandom(size)
+    
+    def _get_virtual_memory(self):
+        """System memory sample, reused for up to 100ms between polls"""
+        sampled_at, sample = self._virtual_memory
+        now = time.monotonic()
+        if sample is None or now - sampled_at > 0.1:
+            sample = psutil.virtual_memory()
+            self._virtual_memory = (now, sample)
+        return sample
     
     def get_memory_stats(self) -> dict:
         """Get memory usage statistics"""
         try:
-            import psutil
+            if self._process is None:
+                return {"error": "psutil not available"}
             
-            process = psutil.Process()
-            memory_info = process.memory_info()
+            memory_info = self._process.memory_info()
+            virtual_memory = self._get_virtual_memory()
             
             return {
                 "rss": memory_info.rss,  # Resident Set Size
                 "vms": memory_info.vms,  # Virtual Memory Size
-                "percent": process.memory_percent(),
-                "available": psutil.virtual_memory().available,
-                "total": psutil.virtual_memory().total,
+                "percent": memory_info.rss / virtual_memory.total * 100,
+                "available": virtual_memory.available,
+                "total": virtual_memory.total,
                 "registered_objects": len(self.registered_objects),
-                "cleanup_callbacks": len(self.cleanup_callbacks)
+                "cleanup_callbacks": len(self.cleanup_finalizers)
             }
             
         except Exception as e:
@@ -318,6 +545,14 @@ class SecureMemoryManager:
             return {"error": str(e)}
 
 
+# Per-platform manager initialization, resolved once for the current platform
+_PLATFORM_INITIALIZERS = {
+    "Windows": SecureMemoryManager._initialize_windows_security,
+    "Darwin": SecureMemoryManager._initialize_macos_security,  # macOS
+    "Linux": SecureMemoryManager._initialize_linux_security
+}
+
+
 # Global secure memory manager instance
 _secure_memory_manager = None
 _manager_lock = threading.Lock()
@@ -327,6 +562,11 @@ def get_secure_memory_manager() -> SecureMemoryManager:
     """Get global secure memory manager instance"""
     global _secure_memory_manager
     
+    # Fast path: once created, the global is only ever read
+    manager = _secure_memory_manager
+    if manager is not None:
+        return manager
+    
     with _manager_lock:
         if _secure_memory_manager is None:
             _secure_memory_manager = SecureMemoryManager()
@@ -349,7 +589,6 @@ def emergency_memory_clear() -> None:
             gc.collect()
             
             # Try to force memory defragmentation (Python-specific)
-            import sys
             if hasattr(sys, 'intern'):
                 # Clear interned strings cache (limited effect)
                 pass
@@ -379,12 +618,9 @@ def enable_process_security() -> bool:
         # Platform-specific hardening
         success = True
         
-        if manager.platform == "Windows":
-            success &= _enable_windows_process_security()
-        elif manager.platform == "Darwin":  # macOS
-            success &= _enable_macos_process_security()
-        elif manager.platform == "Linux":
-            success &= _enable_linux_process_security()
+        hardening = _PROCESS_HARDENING.get(manager.platform)
+        if hardening is not None:
+            success &= hardening()
         
         if success:
             logger.info("🔒 Process security hardening enabled")
@@ -432,13 +668,30 @@ def _enable_linux_process_security() -> bool:
         return False
 
 
-def secure_zero_variable(var_name: str, frame_locals: dict) -> bool:
-    """Securely zero a variable in the calling frame"""
+# Per-platform process hardening, looked up by enable_process_security
+_PROCESS_HARDENING = {
+    "Windows": _enable_windows_process_security,
+    "Darwin": _enable_macos_process_security,  # macOS
+    "Linux": _enable_linux_process_security
+}
+
+
+def secure_zero_variable(var_name: str, frame: Any) -> bool:
+    """Securely zero a variable in the calling frame
+    
+    Pass the frame object (e.g. sys._getframe()). A plain dict is still
+    accepted, but writing to a f_locals snapshot doesn't reach the
+    function's fast locals before Python 3.13.
+    """
     try:
+        frame_locals = frame if isinstance(frame, dict) else frame.f_locals
         if var_name in frame_locals:
             manager = get_secure_memory_manager()
             success = manager.secure_zero_memory(frame_locals[var_name])
             frame_locals[var_name] = None
+            if frame_locals is not frame and _LOCALS_TO_FAST is not None:
+                # Push the snapshot back into the frame's fast locals
+                _LOCALS_TO_FAST(ctypes.py_object(frame), ctypes.c_int(0))
             return success
         return True
         
@@ -471,17 +724,72 @@ def get_memory_usage() -> dict:
 class SecureTemporaryData:
     """Context manager for secure temporary data handling"""
     
+    # Zeroed buffers kept for reuse, oldest first. Bounded by count and total
+    # bytes so pooled memory can't pile up; the oldest entries are dropped first.
+    _pool = deque()
+    _pool_bytes = 0
+    _pool_lock = threading.Lock()
+    _POOL_MAX_ENTRIES = 64
+    _POOL_MAX_BYTES = 1 << 20
+    
     def __init__(self, data: Any):
         """Initialize with data to protect"""
         self.data = data
         self.manager = get_secure_memory_manager()
+        self._pooled = False
+    
+    @staticmethod
+    def _size_class(size: int) -> int:
+        """Power-of-two bucket: sizes in (2**(n-1), 2**n] share bucket n"""
+        return max(1, size - 1).bit_length()
+    
+    @classmethod
+    def buffer(cls, size: int) -> 'SecureTemporaryData':
+        """Context over a zeroed bytearray that is returned to the pool on exit
+        
+        A pooled buffer from the same power-of-two bucket is resized to size
+        (it is all zeros, so growing or trimming keeps it zeroed). The buffer
+        must not be used after the block ends.
+        """
+        size_class = cls._size_class(size)
+        data = None
+        with cls._pool_lock:
+            pool = cls._pool
+            for i in range(len(pool) - 1, -1, -1):  # Most recently returned first
+                if cls._size_class(len(pool[i])) == size_class:
+                    data = pool[i]
+                    del pool[i]
+                    SecureTemporaryData._pool_bytes -= len(data)
+                    break
+        
+        if data is None:
+            data = bytearray(size)
+        elif len(data) > size:
+            del data[size:]
+        elif len(data) < size:
+            data.extend(bytes(size - len(data)))
+        
+        temporary = cls(data)
+        temporary._pooled = True
+        return temporary
     
     def __enter__(self):
         """Enter context - register data for cleanup"""
-        self.manager.register_for_cleanup(self.data)
+        if not self._pooled:  # Pooled bytearrays can't be weakly referenced; __exit__ zeroes them
+            self.manager.register_for_cleanup(self.data)
         return self.data
     
     def __exit__(self, exc_type, exc_val, exc_tb):
         """Exit context - securely clear data"""
-        self.manager.secure_zero_memory(self.data)
-        return False  # Don't suppress exceptions
\ No newline at end of file
+        cleared = self.manager.secure_zero_memory(self.data)
+        if self._pooled and cleared and len(self.data) <= SecureTemporaryData._POOL_MAX_BYTES:
+            # Only zeroed buffers go back, so pool entries never hold secrets
+            with SecureTemporaryData._pool_lock:
+                pool = SecureTemporaryData._pool
+                pool.append(self.data)
+                SecureTemporaryData._pool_bytes += len(self.data)
+                while (len(pool) > SecureTemporaryData._POOL_MAX_ENTRIES
+                       or SecureTemporaryData._pool_bytes > SecureTemporaryData._POOL_MAX_BYTES):
+                    SecureTemporaryData._pool_bytes -= len(pool.popleft())
+        self._pooled = False
+        return False  # Don't suppress exceptions